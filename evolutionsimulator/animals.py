@@ -1,47 +1,140 @@
-from random import randint, shuffle
-from typing import Tuple, List
-from termcolor import colored
+from . import population
+from . import rendering
+from . import spatial
+from typing import Tuple
 
 
 class Animal:
-    """An animal (either mouse or owl)"""
+    """An animal (either mouse or owl), stored as a slot in the environment's population arrays"""
+    __slots__ = ('env', 'pop', 'slot', 'ID', 'adj_legal_tiles')
     sex_dict = {0: "male", 1: "female"}
     dir_options = [(0, 1), (1, 0), (0, -1), (-1, 0), (0, 0)]
+    species = None
 
-    def __init__(self, x_y: Tuple[int, int], parents: List, env) -> None:
+    def __init__(self, x_y: Tuple[int, int], mother, env) -> None:
         """Initialize characteristics for animal"""
-        self.position = x_y
-        self.parents = parents
         self.env = env
-        self.is_pregnant = False
-        self.is_pregnant_with = None
-        self.time_pregnant = 0
-        self.sex = Animal.sex_dict[randint(0, 1)]
-        self.age = 0
-        self.color = None
-        self.has_moved = False
-        self.adj_legal_tiles = self.get_adj_legal_tiles()
-
-        # variables assigning - maybe redo?
-        if isinstance(self, Mouse):
-            self.die_of_hunger = int(self.env.config_parser['MICE']['m_die_of_hunger'])
-            self.preg_time = int(self.env.config_parser['MICE']['m_preg_time'])
-            self.max_age = int(self.env.config_parser['MICE']['m_max_age'])
-        else:
-            self.die_of_hunger = int(self.env.config_parser['OWLS']['o_die_of_hunger'])
-            self.preg_time = int(self.env.config_parser['OWLS']['o_preg_time'])
-            self.max_age = int(self.env.config_parser['OWLS']['o_max_age'])
+        self.pop = env.population
+        sex = self.env.rng.randint(0, 1)
 
         if self.env.in_medias_res and self.die_of_hunger != 0:
-            self.time_since_eaten = randint(0, self.die_of_hunger-1)
+            time_since_eaten = self.env.rng.randint(0, self.die_of_hunger-1)
         else:
-            self.time_since_eaten = 0
+            time_since_eaten = 0
 
         # inheritance
-        if parents and self.env.config_parser['INHERITANCE'].getboolean('speed'):
-            self.speed = self.inherit_speed()
+        if mother:
+            parents = (mother.ID, mother.pop.mate_id[mother.slot])
+            if self.env.inherit_speed:
+                speed = self.inherit_speed(mother.speed, mother.pop.mate_speed[mother.slot])
+            else:
+                speed = self.env.rng.randint(1, 100)
+        else:
+            parents = (population.NO_ANIMAL, population.NO_ANIMAL)
+            speed = self.env.rng.randint(1, 100)
+
+        self.slot = self.pop.add(self, self.species, x_y, speed, sex, time_since_eaten, parents, self.env.replicate)
+        self.ID = int(self.pop.id[self.slot])
+        # filled in when the animal acts
+        self.adj_legal_tiles = []
+
+    @classmethod
+    def from_slot(cls, env, slot: int):
+        """Proxy for an animal whose state is already in the population arrays, e.g. after a restore."""
+        animal = cls.__new__(cls)
+        animal.env = env
+        animal.pop = env.population
+        animal.slot = slot
+        animal.ID = int(animal.pop.id[slot])
+        animal.adj_legal_tiles = []
+        animal.pop.animals[slot] = animal
+        return animal
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return int(self.pop.x[self.slot]), int(self.pop.y[self.slot])
+
+    @position.setter
+    def position(self, x_y: Tuple[int, int]):
+        self.pop.x[self.slot], self.pop.y[self.slot] = x_y
+
+    @property
+    def speed(self) -> int:
+        return int(self.pop.speed[self.slot])
+
+    @speed.setter
+    def speed(self, value: int):
+        self.pop.speed[self.slot] = value
+
+    @property
+    def sex(self) -> str:
+        return Animal.sex_dict[self.pop.sex[self.slot]]
+
+    @property
+    def color(self) -> str:
+        return self.sex_color_dict[self.sex]
+
+    @property
+    def age(self) -> int:
+        return int(self.pop.age[self.slot])
+
+    @age.setter
+    def age(self, value: int):
+        self.pop.age[self.slot] = value
+
+    @property
+    def time_since_eaten(self) -> int:
+        return int(self.pop.time_since_eaten[self.slot])
+
+    @time_since_eaten.setter
+    def time_since_eaten(self, value: int):
+        self.pop.time_since_eaten[self.slot] = value
+
+    @property
+    def is_pregnant(self) -> bool:
+        return bool(self.pop.is_pregnant[self.slot])
+
+    @is_pregnant.setter
+    def is_pregnant(self, value: bool):
+        self.pop.is_pregnant[self.slot] = value
+
+    @property
+    def time_pregnant(self) -> int:
+        return int(self.pop.time_pregnant[self.slot])
+
+    @time_pregnant.setter
+    def time_pregnant(self, value: int):
+        self.pop.time_pregnant[self.slot] = value
+
+    @property
+    def has_moved(self) -> bool:
+        return bool(self.pop.has_moved[self.slot])
+
+    @has_moved.setter
+    def has_moved(self, value: bool):
+        self.pop.has_moved[self.slot] = value
+
+    @property
+    def is_pregnant_with(self):
+        """ID of the father of the current pregnancy, or None."""
+        mate_id = self.pop.mate_id[self.slot]
+        return None if mate_id == population.NO_ANIMAL else int(mate_id)
+
+    @is_pregnant_with.setter
+    def is_pregnant_with(self, father):
+        if father is None:
+            self.pop.mate_id[self.slot] = population.NO_ANIMAL
         else:
-            self.speed = randint(1, 100)
+            self.pop.mate_id[self.slot] = father.ID
+            self.pop.mate_speed[self.slot] = father.speed
+
+    @property
+    def parents(self):
+        """IDs of the mother and father, or None for animals of the initial population."""
+        mother_id = self.pop.mother_id[self.slot]
+        if mother_id == population.NO_ANIMAL:
+            return None
+        return [int(mother_id), int(self.pop.father_id[self.slot])]
 
     def string_speed(self) -> str:
         if self.env.field_size < 5:
@@ -53,34 +146,32 @@ class Animal:
 
     def __str__(self) -> str:
         if self.is_pregnant:
-            return colored(self.string_speed(), self.color, attrs=['underline'])
+            return rendering.colored(self.string_speed(), self.color, attrs=['underline'])
         else:
-            return colored(self.string_speed(), self.color)
+            return rendering.colored(self.string_speed(), self.color)
 
-    def inherit_speed(self) -> int:
-        mean_parent_trait = (self.parents[0].speed+self.parents[1].speed)/2
-        rand_variance_int = randint(-self.env.rand_variance_trait, self.env.rand_variance_trait)
+    def inherit_speed(self, mother_speed: int, father_speed: int) -> int:
+        mean_parent_trait = (mother_speed+father_speed)/2
+        rand_variance_int = self.env.rng.randint(-self.env.rand_variance_trait, self.env.rand_variance_trait)
         rand_trait_contribution = (mean_parent_trait/100)*rand_variance_int
 
         return max(int(mean_parent_trait + rand_trait_contribution), 1)
 
     def is_natural_dead_action(self):
-        if (self.time_since_eaten == self.die_of_hunger and self.die_of_hunger != 0) or (self.age == self.max_age and self.max_age != 0):
-            self.mark_as_dead()
+        if self.time_since_eaten == self.die_of_hunger and self.die_of_hunger != 0:
+            self.mark_as_dead('hunger')
+            return True
+        if self.age == self.max_age and self.max_age != 0:
+            self.mark_as_dead('age')
             return True
 
     def post_action(self) -> None:
-        self.has_moved = True
-        self.age += 1
-        self.time_since_eaten += 1
+        self.pop.has_moved[self.slot] = True
+        self.pop.age[self.slot] += 1
+        self.pop.time_since_eaten[self.slot] += 1
 
     def get_adj_legal_tiles(self):
-        x_pos, y_pos = self.position
-        adj_coordinates = [(x_pos+x_move, y_pos+y_move) for x_move, y_move in Animal.dir_options]
-        adj_legal_coordinates = [coordinates for coordinates in adj_coordinates if self.env.is_legal_coordinates(coordinates)]
-        adj_legal_tiles = [self.env.tiles[y][x] for (x, y) in adj_legal_coordinates if not self.env.tiles[y][x].rock]
-        shuffle(adj_legal_tiles)
-        return adj_legal_tiles
+        return self.env.get_adj_legal_tiles(self.position)
 
     def get_owl_tiles(self):
         return [tile for tile in self.adj_legal_tiles if isinstance(tile.animal, Owl)]
@@ -103,34 +194,52 @@ class Animal:
     def get_move_tiles(self):
         return [tile for tile in self.adj_legal_tiles if not tile.animal or tile.animal == self]
 
-    def mark_as_dead(self):
+    def mark_as_dead(self, cause=None):
         pass
 
 
 class Mouse(Animal):
     """A mouse"""
-    ID = 0
+    __slots__ = ()
+    species = population.MOUSE
     sex_color_dict = {'male': "blue", 'female': 'cyan'}
 
-    def __init__(self, x_y: Tuple[int, int], parents, env=None) -> None:
-        super().__init__(x_y, parents, env)
-        self.ID = Mouse.ID
-        Mouse.ID += 1
-        self.color = Mouse.sex_color_dict[self.sex]
+    @property
+    def die_of_hunger(self) -> int:
+        return self.env.m_die_of_hunger
+
+    @property
+    def preg_time(self) -> int:
+        return self.env.m_preg_time
 
-    def mark_as_dead(self) -> None:
-        self.env.mice.remove(self)
-        self.env.mice_alive -= 1
-        self.env.clear_field_of_animal(self)
+    @property
+    def max_age(self) -> int:
+        return self.env.m_max_age
+
+    @property
+    def vision(self) -> int:
+        return self.env.m_vision
+
+    def mark_as_dead(self, cause=None) -> None:
+        self.env.remove_animal(self, cause)
 
     def owl_near_action(self, empty_tiles) -> bool:
-        if self.get_owl_tiles() and empty_tiles:
+        if self.vision > 1:
+            # flee from the nearest owl in sight
+            owl_position = self.env.nearest_animal(population.OWL, self.position, self.vision)
+            if owl_position and empty_tiles:
+                self.env.animal_move_to(self, max(empty_tiles,
+                                                  key=lambda tile: spatial.distance(tile.position, owl_position)))
+                return True
+
+        elif self.get_owl_tiles() and empty_tiles:
             self.env.animal_move_to(self, empty_tiles[0])
             return True
 
     def is_birth_time_action(self, empty_tiles):
         if empty_tiles and self.time_pregnant >= self.preg_time != 0:
-            self.env.add_animal_at("mouse", empty_tiles[0], parents=[self, self.is_pregnant_with])
+            self.env.add_animal_at("mouse", empty_tiles[0], mother=self)
+            self.env.births[self.species] += 1
             self.time_pregnant = 0
             self.is_pregnant = False
             self.is_pregnant_with = None
@@ -143,50 +252,68 @@ class Mouse(Animal):
 
     def action(self):
         if not self.has_moved:
+            profiler = self.env.profiler
+            if profiler:
+                profiler.start_action()
             # Check for death conditions (death of age).
-            if not self.is_natural_dead_action():
+            if self.is_natural_dead_action():
+                branch = 'die'
+            else:
                 if self.is_pregnant:  # add pregnant time.
                     self.time_pregnant += 1
 
                 self.adj_legal_tiles = self.get_adj_legal_tiles()
 
                 empty_tiles = self.get_empty_tiles()
-                if not self.owl_near_action(empty_tiles):
-
-                    if not self.is_birth_time_action(empty_tiles):
-
-                        grass_tiles = self.get_grass_tiles()
-
-                        if not self.eat_grass_action(grass_tiles):
-
-                            # final move action
-                            move_tiles = self.get_move_tiles()
-                            if move_tiles:
-                                self.env.animal_move_to(self, move_tiles[0])
+                if self.owl_near_action(empty_tiles):
+                    branch = 'flee'
+                elif self.is_birth_time_action(empty_tiles):
+                    branch = 'birth'
+                elif self.eat_grass_action(self.get_grass_tiles()):
+                    branch = 'eat'
+                else:
+                    # final move action
+                    branch = 'move'
+                    move_tiles = self.get_move_tiles()
+                    if move_tiles:
+                        self.env.animal_move_to(self, move_tiles[0])
 
                 self.post_action()
 
+            if profiler:
+                profiler.stop_action(self.species, branch)
+
 
 class Owl(Animal):
     """An owl"""
-    ID = 0
+    __slots__ = ()
+    species = population.OWL
     sex_color_dict = {'male': "red", 'female': 'yellow'}
 
-    def __init__(self, x_y: Tuple[int, int], parents: List[object], env: [object] = None):
-        super().__init__(x_y, parents, env)
-        self.ID = Owl.ID
-        Owl.ID += 1
-        self.color = Owl.sex_color_dict[self.sex]
+    @property
+    def die_of_hunger(self) -> int:
+        return self.env.o_die_of_hunger
+
+    @property
+    def preg_time(self) -> int:
+        return self.env.o_preg_time
+
+    @property
+    def max_age(self) -> int:
+        return self.env.o_max_age
 
-    def mark_as_dead(self):
-        self.env.owls.remove(self)
-        self.env.owls_alive -= 1
-        self.env.clear_field_of_animal(self)
+    @property
+    def vision(self) -> int:
+        return self.env.o_vision
+
+    def mark_as_dead(self, cause=None):
+        self.env.remove_animal(self, cause)
 
     def is_birth_time_action(self):
         empty_tiles = self.get_empty_tiles()
         if self.time_pregnant >= self.preg_time != 0 and empty_tiles:
             self.env.add_animal_at("owl", empty_tiles[0])
+            self.env.births[self.species] += 1
             self.time_pregnant = 0
             self.is_pregnant = False
             self.is_pregnant_with = None
@@ -207,48 +334,71 @@ class Owl(Animal):
             # random catch ON
             if self.env.rand_catch:
                 owl_to_mouse_speed_percentage = round(100*(self.speed/mouse_near.speed))
-                rand_int = randint(1, 100)
+                rand_int = self.env.rng.randint(1, 100)
                 if rand_int <= owl_to_mouse_speed_percentage:
-                    mouse_near.mark_as_dead()
+                    mouse_near.mark_as_dead('eaten')
                     self.time_since_eaten = 0
                     self.env.animal_move_to(self, mouse_tiles[0])
 
                 else:
                     mouse_near.action()
                     if mouse_tiles[0].animal:
-                        mouse_near.mark_as_dead()
+                        mouse_near.mark_as_dead('eaten')
                         self.time_since_eaten = 0
                     self.env.animal_move_to(self, mouse_tiles[0])
 
             # random catch OFF
             elif not self.env.rand_catch:
                 if mouse_near.speed <= self.speed:
-                    mouse_near.mark_as_dead()
+                    mouse_near.mark_as_dead('eaten')
                     self.time_since_eaten = 0
                     self.env.animal_move_to(self, mouse_tiles[0])
 
                 else:
                     mouse_near.action()
                     if mouse_tiles[0].animal:
-                        mouse_near.mark_as_dead()
+                        mouse_near.mark_as_dead('eaten')
                         self.time_since_eaten = 0
                     self.env.animal_move_to(self, mouse_tiles[0])
 
             return True
 
+    def stalk_mouse_action(self):
+        # move towards the nearest mouse in sight
+        if self.vision > 1:
+            mouse_position = self.env.nearest_animal(population.MOUSE, self.position, self.vision)
+            move_tiles = self.get_move_tiles()
+            if mouse_position and move_tiles:
+                self.env.animal_move_to(self, min(move_tiles,
+                                                  key=lambda tile: spatial.distance(tile.position, mouse_position)))
+                return True
+
     def action(self):
         if not self.has_moved:
-            if not self.is_natural_dead_action():
+            profiler = self.env.profiler
+            if profiler:
+                profiler.start_action()
+            if self.is_natural_dead_action():
+                branch = 'die'
+            else:
                 if self.is_pregnant:
                     self.time_pregnant += 1
 
                 self.adj_legal_tiles = self.get_adj_legal_tiles()
 
-                if not self.is_birth_time_action():
-                    if not self.find_mouse_action():
-
-                        move_tiles = self.get_move_tiles()
-                        if move_tiles:
-                            self.env.animal_move_to(self, move_tiles[0])
+                if self.is_birth_time_action():
+                    branch = 'birth'
+                elif self.find_mouse_action():
+                    branch = 'hunt'
+                elif self.stalk_mouse_action():
+                    branch = 'stalk'
+                else:
+                    branch = 'move'
+                    move_tiles = self.get_move_tiles()
+                    if move_tiles:
+                        self.env.animal_move_to(self, move_tiles[0])
 
                 self.post_action()
+
+            if profiler:
+                profiler.stop_action(self.species, branch)
@@ -1,31 +1,172 @@
-import pkg_resources
-import environment as environment
+from . import environment
+from . import randomness
+from . import results
+from . import telemetry
+from . import ensemble
+from . import config
+from . import profiling
+from . import estimation
+from . import paths
+from . import work_queue
+import numpy as np
 import configparser
+import contextlib
 import csv
 import re
 import time
 import sys
+import os
+import json
+import hashlib
 import multiprocessing
-from psutil import cpu_count
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 
 ########################
 # CONFIG FILE TO BE USED FOR SIMULATION IF CALLED WITHOUT COMMAND LINE ARGUMENT
-cfg_file = 'evolutionsimulator/configs/automatic_testing/mice_and_owls.ini'
+cfg_file = paths.package_path('configs', 'automatic_testing', 'mice_and_owls.ini')
 ########################
 # OUTPUT FILE FOR SIMULATION RESULTS
 # IF IT DOESN'T EXIST, A NEW ONE WILL BE CREATED. OTHERWISE DATA WILL BE APPENDED TO.
+# IF THE EXISTING FILE HAS DIFFERENT COLUMNS, RESULTS GO TO A NUMBERED FILE NEXT TO IT.
 results_file = 'evolutionsimulator/results/automatic_testing.csv'
 
 
-########################
+def get_job_id(repetition, sim_config, run, base_seed=None):
+    """Stable hash identifying one simulation: its config.SimConfig, the run settings that change
+    its outcome, its repetition number and the base seed."""
+    return hashlib.sha1(json.dumps([repetition, sim_config.key(), run.values(), base_seed]).encode()).hexdigest()
+
+
+def default_workers():
+    """Number of physical cores. psutil is imported here, so worker processes never load it."""
+    from psutil import cpu_count
+    return cpu_count(logical=False)
+
+
+def run_job(job):
+    """Run the simulation of a (job_id, sim_config, run, seed, telemetry_file) job.
+
+    Returns (job_id, results row, profiler), where profiler is None unless run.profile is on."""
+    job_id, sim_config, run, seed, telemetry_file = job
+    profiler = profiling.Profiler() if run.profile else None
+    return job_id, run_single_simulation(sim_config, run, seed, telemetry_file, profiler), profiler
+
+
+def run_jobs(job):
+    """run_job for a single job, returning its result in a list like run_ensemble_job."""
+    return [run_job(job)]
+
+
+def run_single_simulation(sim_config, run, seed=None, telemetry_file=None, profiler=None):
+    """Run one simulation of a config.SimConfig as set by the config.RunSettings run, and return its results row.
+
+    The same config and seed always give the same row. With a telemetry_file, per-tick metrics
+    are recorded every run.telemetry_every ticks, and a given profiler collects the time spent
+    in each tick phase."""
+    # create environment and simulate number of ticks
+    object_environment = environment.Environment(sim_config, seed)
+    object_environment.profiler = profiler
+    recorder = add_telemetry(object_environment, telemetry_file, run)
+    stop_tick = object_environment.multiple_ticks(*run.run_length())
+    if recorder:
+        recorder.close()
+
+    return get_results_row(sim_config, run, object_environment, stop_tick)
+
+
+def run_ensemble_job(jobs):
+    """Run the repetitions of one config, given as run_job jobs, together as an ensemble.Ensemble.
+
+    Returns a list of (job_id, results row, None), one per repetition."""
+    sim_config, run = jobs[0][1], jobs[0][2]
+    replicates = ensemble.Ensemble(sim_config, len(jobs), seeds=[job[3] for job in jobs])
+    recorders = [add_telemetry(env, telemetry_file, run)
+                 for env, (job_id, job_config, job_run, seed, telemetry_file) in zip(replicates.environments, jobs)]
+    stop_ticks = replicates.multiple_ticks(*run.run_length())
+    for recorder in recorders:
+        if recorder:
+            recorder.close()
+
+    return [(job[0], get_results_row(sim_config, run, env, stop_tick), None)
+            for job, env, stop_tick in zip(jobs, replicates.environments, stop_ticks)]
+
+
+def add_telemetry(object_environment, telemetry_file, run):
+    if not telemetry_file:
+        return None
+    recorder = telemetry.TelemetryRecorder(telemetry_file, run.telemetry_every)
+    object_environment.add_observer(recorder)
+    return recorder
+
+
+def get_results_row(sim_config, run, object_environment, stop_tick):
+    # copy specific sim configuration into list
+    sim_data = sim_config.values() + run.values()
+
+    # add average speed, mice alive and owls alive and simulation version to row data
+    sim_data.extend(object_environment.average_speed())
+    sim_data.extend([object_environment.mice_alive, object_environment.owls_alive])
+    sim_data.append(object_environment.sim_version)
+    sim_data.append(object_environment.seed)
+    sim_data.append(stop_tick)
+
+    return sim_data
+
+
+def run_in_pool(executor, jobs, max_pending, job_function=run_job):
+    """Yield the job_function results as workers finish, keeping at most max_pending jobs in flight.
+
+    Closing the generator, e.g. on Ctrl-C, cancels the jobs that have not started yet, so the
+    executor doesn't run them only for their results to be thrown away."""
+    pending = set()
+    try:
+        for job in jobs:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(job_function, job))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class Tester:
-    def __init__(self, cfg_file_param):
+    def __init__(self, cfg_file_param, assume_yes=False):
         self.cfg_file_name = cfg_file_param
         self.config_parser = configparser.ConfigParser()
         self.config_parser.read(self.cfg_file_name)
         self.sim_specific_vars = self.get_sim_specific_vars()
         self.multicore_mode = self.config_parser['AUTO_TESTING'].getboolean("multi-core_mode")
+        self.workers = int(self.config_parser['AUTO_TESTING'].get('workers') or default_workers())
+        self.resume = self.config_parser['AUTO_TESTING'].getboolean('resume', fallback=False)
+        self.base_seed = self.config_parser['AUTO_TESTING'].get('seed')
+        self.base_seed = int(self.base_seed) if self.base_seed else None
+        self.results_format = self.config_parser['AUTO_TESTING'].get('results_format', 'csv')
+        self.batch_size = int(self.config_parser['AUTO_TESTING'].get('batch_size', 1000))
+        self.run_settings = config.RunSettings.from_section(self.config_parser['AUTO_TESTING'])
+        self.telemetry_every = self.run_settings.telemetry_every
+        self.profile = self.run_settings.profile
+        self.ensemble = self.config_parser['AUTO_TESTING'].getboolean('ensemble', fallback=False)
+        self.confirm = self.config_parser['AUTO_TESTING'].getboolean('confirm', fallback=True) and not assume_yes
+        self.queue_file = self.config_parser['AUTO_TESTING'].get('queue')
+        self.lease_seconds = float(self.config_parser['AUTO_TESTING'].get('lease_seconds', 600))
+        self.max_attempts = int(self.config_parser['AUTO_TESTING'].get('max_attempts', 3))
+        self.profiler = profiling.Profiler()
+        if self.workers < 1 and not self.queue_file:
+            raise ValueError('workers must be at least 1, or 0 with a queue to leave the work to remote workers')
+        if self.profile and self.ensemble:
+            raise ValueError('profile is not available with ensemble, as an ensemble has no per-replicate tick phases')
+        if self.profile and self.queue_file:
+            raise ValueError('profile is not available with queue, as workers only send back results rows')
+        if self.ensemble and self.queue_file:
+            raise ValueError('ensemble is not available with queue, as workers run one simulation at a time')
         self.regex_range = r"([0-9]+)[^0-9]*([0-9]*)[^0-9]*([0-9]*)"
 
         # load configs file into nested dict of value lists
@@ -33,12 +174,17 @@ class Tester:
         for section in self.config_parser.sections():
             self.config_dict[section] = {}
             for (var_name, val) in self.config_parser.items(section):
-                if val not in ['True', 'False']:
+                if val not in ['True', 'False'] and re.match(self.regex_range, val):
                     self.config_dict[section][var_name] = self.get_config_values(
                         self.config_parser[str(section)][str(var_name)])
+        self.base_config = self.get_base_config()
+        self.done_jobs = set()
 
+    def start(self):
+        """Create the results file, ask for confirmation and run the sweep."""
         # Create file for simulation results with header if not exists
         self.create_results_file()
+        self.done_jobs = self.load_done_jobs() if self.resume else set()
 
         # Ask for confirmation and run if positive
         if self.confirm_test_prompt():
@@ -59,150 +205,284 @@ class Tester:
             return [int(min_val)]
 
     def get_sim_specific_vars(self):
-        vars = []
-        for section in self.config_parser.sections():
-            for (key, val) in self.config_parser.items(section):
-                vars.append(key)
-
-        to_be_removed = ['repetitions', 'multi-core_mode']
-        for element in to_be_removed:
-            vars.remove(element)
+        vars = [key for (section, key, attribute, kind, default) in config.settings] + config.RunSettings.columns
 
-        to_be_added = ['avg_speed_mouse', 'avg_speed_owl', "m_alive", "o_alive", "sim ver"]
+        to_be_added = ['avg_speed_mouse', 'avg_speed_owl', "m_alive", "o_alive", "sim ver", "seed", "stop_tick"]
         vars.extend(to_be_added)
 
         return vars
 
     def create_results_file(self):
+        if self.results_format == 'npz':
+            # a directory of column batches, which can be shared by several sweeps
+            self.results_file = os.path.splitext(results_file)[0]
+            os.makedirs(self.results_file, exist_ok=True)
+            self.done_file = os.path.join(self.results_file, 'jobs.done')
+            return
+        elif self.results_format != 'csv':
+            raise ValueError(f"Unknown results_format '{self.results_format}', use csv or npz")
+
+        # a sweep can be started from any directory, e.g. by a cluster job
+        os.makedirs(os.path.dirname(results_file), exist_ok=True)
+        self.results_file = results_file
+        file_number = 0
+        while True:
+            try:
+                with open(self.results_file, 'x', newline='') as csv_file:
+                    writer = csv.writer(csv_file, delimiter=',')
+                    writer.writerow(self.sim_specific_vars)
+                break
+
+            except FileExistsError:
+                # append only to a file with the same columns
+                with open(self.results_file, newline='') as csv_file:
+                    if next(csv.reader(csv_file), None) == self.sim_specific_vars:
+                        break
+                file_number += 1
+                self.results_file = f'{os.path.splitext(results_file)[0]}_{file_number}.csv'
+
+        # index of finished simulations, used to skip them when a sweep is resumed
+        self.done_file = os.path.splitext(self.results_file)[0] + '.done'
+
+    def load_done_jobs(self):
         try:
-            with open(results_file, 'x', newline='') as csv_file:
-                writer = csv.writer(csv_file, delimiter=',')
-                writer.writerow(self.sim_specific_vars)
-
-        except FileExistsError:
-            pass
+            with open(self.done_file) as index_file:
+                return set(index_file.read().split())
+        except FileNotFoundError:
+            return set()
 
     def get_number_of_configs(self):
         num_of_configs = 1
-        for section in self.config_dict.values():
-            for value_list in section.values():
-                num_of_configs *= len(value_list)
+        for (section, key, values) in self.get_grid():
+            num_of_configs *= len(values)
 
         return num_of_configs
 
+    def count_jobs_left(self):
+        """Number of simulations of this grid that are not listed as done. The done file can also
+        list simulations of other sweeps that append to the same results file."""
+        return sum(get_job_id(i, sim_config, self.run_settings, self.base_seed) not in self.done_jobs
+                   for sim_config in self.get_sim_configs()
+                   for i in range(self.config_dict['AUTO_TESTING']['repetitions'][0]))
+
     def confirm_test_prompt(self):
         # Get required numbers for prompt
         self.num_of_configs = self.get_number_of_configs()
         num_of_simulations = self.num_of_configs * self.config_dict['AUTO_TESTING']['repetitions'][0]
-        single_run_time = self.run_simulations(single_run=True)
-        num_cores = cpu_count(logical=False)
-
-        # Ask for input
-        if self.multicore_mode:
-            answer = input(f"You have selected {num_of_simulations}"
-                           f" simulations to be run at {self.config_dict['AUTO_TESTING']['ticks'][0]} ticks each, based on"
-                           f" {self.num_of_configs} different configurations.\nThis will take approximately"
-                           f" {round((single_run_time * num_of_simulations / 60) / num_cores, 2)} minutes to perform on {num_cores} cores.\n\nDo you wish to continue? y/n:")
+        self.simulations_left = self.count_jobs_left() if self.done_jobs else num_of_simulations
+        self.estimated_time = self.estimate_time(self.simulations_left)
+        if self.queue_file and self.multicore_mode and not self.workers:
+            mode = "by the workers that join the queue"
         else:
-            answer = input(f"You have selected {num_of_simulations}"
-                           f" simulations to be run at {self.config_dict['AUTO_TESTING']['ticks'][0]} ticks each, based on"
-                           f" {self.num_of_configs} different configurations.\nThis will take approximately"
-                           f" {round((single_run_time * num_of_simulations / 60), 2)} minutes to perform using the single core mode.\n\nDo you wish to continue? y/n:")
-
-        return answer == 'y'
-
-    def run_1_rep(self):
-        pass
-
-    def run_simulations(self, single_run=False):
-        # TODO: Does this ruin multi-core processing? Check it
-        with open(results_file, 'a+', newline='') as csv_file:
-            writer = csv.writer(csv_file, delimiter=',')
-
-            processes = []
-            if not single_run:
-                print('\nRunning simulations... Can be stopped at any time and results will be saved.')
+            mode = f"on {self.workers} cores" if self.multicore_mode else "using the single core mode"
+        print(f"You have selected {num_of_simulations}"
+              f" simulations to be run at {self.config_dict['AUTO_TESTING']['ticks'][0]} ticks each, based on"
+              f" {self.num_of_configs} different configurations.\nThis will take about"
+              f" {estimation.format_duration(self.estimated_time)} to perform {mode}.")
+
+        # Ask for input, unless running unattended
+        if not self.confirm:
+            return True
+        return input("\nDo you wish to continue? y/n:") == 'y'
+
+    def estimate_time(self, simulations, samples=4):
+        """Seconds the given number of simulations will take, from a cost model calibrated by
+        timing a few ticks of up to samples configs spread over the grid."""
+        if not simulations:
+            return 0
+        indices = sorted(set(np.linspace(0, self.num_of_configs - 1, min(samples, self.num_of_configs))
+                             .round().astype(int).tolist()))
+        sim_configs = [self.get_sim_config(i) for i in indices]
+        model = estimation.CostModel()
+        model.calibrate(sim_configs, self.config_dict['AUTO_TESTING']['ticks'][0])
+
+        # the cost only depends on the board size and the number of animals, so average over those
+        swept = {(section, key): values for (section, key, values) in self.get_grid()}
+        first = sim_configs[0]
+        dimensions, mice, owls = np.meshgrid(swept.get(('ENVIRONMENT', 'dimensions'), [first.dimensions]),
+                                             swept.get(('MICE', 'm_number'), [first.m_number]),
+                                             swept.get(('OWLS', 'o_number'), [first.o_number]), indexing='ij')
+        seconds = float(model.predict(dimensions, mice + owls).mean()) * simulations
+        if self.multicore_mode and self.workers:
+            seconds /= min(self.workers, simulations)
+        return seconds
+
+    def get_grid(self):
+        """List (section, key, values) for every numeric setting that makes up the config grid."""
+        return [(section, key, values) for section, section_values in self.config_dict.items()
+                for key, values in section_values.items() if (section, key) in config.attributes]
+
+    def get_base_config(self):
+        """The config.SimConfig at the first value of every range, which the grid points are copies of."""
+        sections = {section: dict(self.config_parser[section]) for section in self.config_parser.sections()}
+        for (section, key, values) in self.get_grid():
+            sections[section][key] = str(values[0])
+        return config.SimConfig.from_dict(sections)
+
+    def get_seed(self, job_id):
+        """With a base seed every job gets its own seed derived from its ID, otherwise a fresh one."""
+        if self.base_seed is None:
+            return randomness.new_seed()
+        return int(job_id[:15], 16)
+
+    def get_telemetry_file(self, job_id):
+        if not self.telemetry_every:
+            return None
+        telemetry_dir = os.path.splitext(self.results_file)[0] + '_telemetry'
+        os.makedirs(telemetry_dir, exist_ok=True)
+        return os.path.join(telemetry_dir, job_id + '.jsonl')
+
+    def get_jobs(self):
+        """Lazily expand the config grid into (job_id, sim_config, run, seed, telemetry_file) jobs, one per simulation.
+
+        Every key given as a range in any section is swept. Configs are produced one at a time,
+        so the full Cartesian product is never held in memory. When resuming, jobs already
+        listed in the done file are skipped."""
+        for i in range(self.config_dict['AUTO_TESTING']['repetitions'][0]):
+            print(f"\nSimulating repetition {i + 1} of {self.config_dict['AUTO_TESTING']['repetitions'][0]} "
+                  f"repetitions for given configs.")
+
+            for sim_config in self.get_sim_configs():
+                job = self.get_job(i, sim_config)
+                if job:
+                    yield job
+
+    def get_ensemble_jobs(self):
+        """Like get_jobs, but yield one list of jobs per config, holding all its repetitions that are not done yet."""
+        print(f"Simulating the {self.config_dict['AUTO_TESTING']['repetitions'][0]} repetitions of each config "
+              f"as an ensemble.")
+        for sim_config in self.get_sim_configs():
+            jobs = [self.get_job(i, sim_config) for i in range(self.config_dict['AUTO_TESTING']['repetitions'][0])]
+            jobs = [job for job in jobs if job]
+            if jobs:
+                yield jobs
+
+    def get_sim_configs(self):
+        """Yield the config.SimConfig of every point of the grid, one at a time."""
+        grid = self.get_grid()
+        for grid_values in product(*[values for (section, key, values) in grid]):
+            yield self.expand_config(grid, grid_values)
+
+    def get_sim_config(self, index):
+        """The expanded config at position index of get_sim_configs, without expanding the ones before it."""
+        grid = self.get_grid()
+        grid_values = []
+        for (section, key, values) in reversed(grid):
+            index, value_index = divmod(index, len(values))
+            grid_values.append(values[value_index])
+        return self.expand_config(grid, reversed(grid_values))
+
+    def expand_config(self, grid, grid_values):
+        # an invalid grid point fails here, before it is handed to a worker
+        return self.base_config.replace(**{config.attributes[(section, key)]: value
+                                           for (section, key, values), value in zip(grid, grid_values)})
+
+    def get_job(self, repetition, sim_config):
+        """The (job_id, sim_config, run, seed, telemetry_file) job of one repetition of a config, or None if done."""
+        job_id = get_job_id(repetition, sim_config, self.run_settings, self.base_seed)
+        if job_id not in self.done_jobs:
+            return job_id, sim_config, self.run_settings, self.get_seed(job_id), self.get_telemetry_file(job_id)
+
+    def open_results(self):
+        if self.results_format == 'npz':
+            return results.NpzResultsWriter(self.results_file, self.sim_specific_vars, self.done_file,
+                                            self.batch_size)
+        return results.CsvResultsWriter(self.results_file, self.done_file)
+
+    def run_simulations(self):
+        with self.open_results() as results_writer:
+
+            def save_result(job_id, sim_data, profiler):
+                results_writer.write(job_id, sim_data)
+                self.done_jobs.add(job_id)
+                if profiler:
+                    self.profiler.merge(profiler)
+                progress.update()
 
             t0 = time.time()
-
-            for i in range(self.config_dict['AUTO_TESTING']['repetitions'][0]):
-                if not single_run:
-                    print(
-                        f"Simulating repetition {i + 1} of {self.config_dict['AUTO_TESTING']['repetitions'][0]} repetitions for given configs.")
-                for value_grass_grow_back in self.config_dict['ENVIRONMENT']['grass_grow_back']:
-                    self.config_parser.set("ENVIRONMENT", "grass_grow_back", str(value_grass_grow_back))
-
-                    for m_value_hunger in self.config_dict['MICE']['m_die_of_hunger']:
-                        self.config_parser.set("MICE", "m_die_of_hunger", str(m_value_hunger))
-
-                        for m_value_preg_time in self.config_dict['MICE']['m_preg_time']:
-                            self.config_parser.set("MICE", "m_preg_time", str(m_value_preg_time))
-
-                            for m_value_number in self.config_dict['MICE']['m_number']:
-                                self.config_parser.set("MICE", "m_number", str(m_value_number))
-
-                                for o_value_hunger in self.config_dict['OWLS']['o_die_of_hunger']:
-                                    self.config_parser.set("OWLS", "o_die_of_hunger", str(o_value_hunger))
-
-                                    for o_value_preg_time in self.config_dict['OWLS']['o_preg_time']:
-                                        self.config_parser.set("OWLS", "o_preg_time", str(o_value_preg_time))
-
-                                        for o_value_number in self.config_dict['OWLS']['o_number']:
-                                            self.config_parser.set("OWLS", "o_number", str(o_value_number))
-
-                                            for rand_variance_trait_value in self.config_dict['INHERITANCE']['rand_variance_trait']:
-                                                self.config_parser.set("INHERITANCE", "rand_variance_trait",
-                                                                       str(rand_variance_trait_value))
-
-                                                if single_run:
-                                                    self.run_single_simulation(csv_file, writer)
-                                                    t1 = time.time()
-                                                    return t1 - t0
-
-                                                else:
-                                                    # MULTI-CORE ENABLED
-                                                    if self.multicore_mode:
-                                                        p = multiprocessing.Process(
-                                                            target=self.run_single_simulation(csv_file, writer))
-                                                        processes.append(p)
-                                                        p.start()
-
-                                                    else:
-                                                        self.run_single_simulation(csv_file, writer)
-
-        for process in processes:
-            process.join()
+            progress = estimation.Progress(self.simulations_left, self.estimated_time)
+            print('\nRunning simulations... Can be stopped at any time and results will be saved.')
+            if self.resume:
+                print(f'Resuming: simulations listed in {self.done_file} are skipped.')
+
+            if self.ensemble:
+                jobs, job_function = self.get_ensemble_jobs(), run_ensemble_job
+            else:
+                jobs, job_function = self.get_jobs(), run_jobs
+
+            try:
+                # DISTRIBUTED OVER A WORK QUEUE
+                if self.queue_file:
+                    self.run_queue(jobs, save_result)
+
+                # MULTI-CORE ENABLED
+                elif self.multicore_mode:
+                    # closed before the executor shuts down, which waits for every job it was given
+                    with ProcessPoolExecutor(max_workers=self.workers) as executor, \
+                            contextlib.closing(run_in_pool(executor, jobs, 2 * self.workers, job_function)) as pool:
+                        for job_results in pool:
+                            for job_result in job_results:
+                                save_result(*job_result)
+
+                else:
+                    for job in jobs:
+                        for job_result in job_function(job):
+                            save_result(*job_result)
+
+            except KeyboardInterrupt:
+                print('\nSimulation stopped.')
 
         full_simulation_time = time.time()
         print(f'\n\nTesting completed in {round((full_simulation_time - t0) / 60, 2)} minutes.\n')
-        print(f'Results appended to {results_file}.\n')
-
-    def run_single_simulation(self, csv_file, writer):
-        # copy specific sim configuration into list
-        sim_data = []
-        for section in self.config_parser.sections():
-            for (key, val) in self.config_parser.items(section):
-                if key in self.sim_specific_vars:
-                    sim_data.append(val)
-
-        # create environment and simulate number of ticks
-        object_environment = environment.Environment(self.config_parser)
-        object_environment.multiple_ticks(self.config_dict['AUTO_TESTING']['ticks'][0])
-
-        # add average speed, mice alive and owls alive and simulation version to row data
-        sim_data.extend(object_environment.average_speed())
-        sim_data.extend([object_environment.mice_alive, object_environment.owls_alive])
-        sim_data.append(object_environment.sim_version)
-
-        # write full row data into file
-        # TODO: Old implementation commented out
-        # with open(results_file, 'a+', newline='') as csv_file:
-        # writer = csv.writer(csv_file, delimiter=',')
-        writer.writerow(sim_data)
+        print(f'Results appended to {self.results_file}.\n')
+        if self.profile:
+            print(self.profiler.summary() + '\n')
+
+    def run_queue(self, jobs, save_result, poll_seconds=1):
+        """Put the jobs in the work queue and save the results as workers finish them.
+
+        Workers on any machine that sees the queue file can join with `simulate worker <queue>`.
+        In multi-core mode, AUTO_TESTING workers local workers are started as well, otherwise one.
+        Local workers that die are replaced, and jobs they held are retried once their lease runs out."""
+        with work_queue.WorkQueue(self.queue_file, self.lease_seconds, self.max_attempts) as queue:
+            # telemetry is written by the workers, which may run in other directories
+            added = queue.add_jobs((job_id, sim_config, run, seed, telemetry_file and os.path.abspath(telemetry_file))
+                                   for job_id, sim_config, run, seed, telemetry_file in jobs)
+            print(f'{added} simulations added to the work queue {self.queue_file}. More workers can join with '
+                  f'`simulate worker {self.queue_file}`.')
+
+            local_workers = [self.start_local_worker() for i in range(self.workers if self.multicore_mode else 1)]
+            try:
+                while True:
+                    # check first, so the last round collects everything that finished before it
+                    finished = queue.is_finished()
+                    for job_id, sim_data in queue.collect():
+                        save_result(job_id, sim_data, None)
+                    if finished:
+                        break
+                    # a worker only stops by itself once the queue is finished, so replace the ones that died
+                    for i, local_worker in enumerate(local_workers):
+                        if local_worker.exitcode not in (None, 0):
+                            print(f'\nLocal worker {i + 1} died with exit code {local_worker.exitcode}, '
+                                  f'starting a new one.')
+                            local_workers[i] = self.start_local_worker()
+                    time.sleep(poll_seconds)
+            finally:
+                for local_worker in local_workers:
+                    local_worker.join()
+
+            errors = queue.errors()
+            if errors:
+                print(f'\n{len(errors)} simulations failed {self.max_attempts} times and were given up. '
+                      f'The first error was:\n{errors[0][1]}')
+
+    def start_local_worker(self):
+        local_worker = multiprocessing.Process(target=work_queue.run_worker, args=(self.queue_file,))
+        local_worker.start()
+        return local_worker
 
 
 if __name__ == '__main__':
-    try:
-        Tester(sys.argv[1])
-    except IndexError:
-        Tester(cfg_file)
+    # -y or --yes starts the sweep without asking, like AUTO_TESTING confirm = False
+    args = [arg for arg in sys.argv[1:] if arg not in ('-y', '--yes')]
+    Tester(args[0] if args else cfg_file, assume_yes=len(args) < len(sys.argv) - 1).start()
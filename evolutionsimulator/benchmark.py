@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from . import config
+from . import environment
+
+########################
+# SETTINGS SHARED BY ALL BENCHMARK CASES. EACH CASE OVERRIDES SOME OF THEM.
+base_config = {'ENVIRONMENT': {'dimensions': '20', 'rock_chance': '0', 'grass_grow_back': '5'},
+               'MECHANICS': {'owls_target_slow_mice': 'False', 'rand_catch': 'True', 'in_medias_res': 'True'},
+               'MICE': {'m_number': '200', 'm_die_of_hunger': '5', 'm_preg_time': '3', 'm_max_age': '0'},
+               'OWLS': {'o_number': '10', 'o_die_of_hunger': '15', 'o_preg_time': '10', 'o_max_age': '0'},
+               'INHERITANCE': {'rand_variance_trait': '20', 'speed': 'True'},
+               'AUTO_TESTING': {'ticks': '50'}}
+
+# density is the share of tiles holding a mouse at the start, with one owl per 20 mice
+matrix = {'dimensions': [25, 50, 100],
+          'density': [0.1, 0.5],
+          'rock_chance': [0, 20],
+          'grass_grow_back': [2, 10]}
+quick_matrix = {'dimensions': [20, 40],
+                'density': [0.3],
+                'rock_chance': [0],
+                'grass_grow_back': [5]}
+########################
+
+
+def get_config(dimensions, density, rock_chance, grass_grow_back, ticks=50):
+    config = {section: dict(values) for section, values in base_config.items()}
+    m_number = int(density * dimensions ** 2)
+    config['ENVIRONMENT'].update(dimensions=str(dimensions), rock_chance=str(rock_chance),
+                                 grass_grow_back=str(grass_grow_back))
+    config['MICE']['m_number'] = str(m_number)
+    config['OWLS']['o_number'] = str(m_number // 20)
+    config['AUTO_TESTING']['ticks'] = str(ticks)
+    return config
+
+
+def run_tick_benchmark(case, ticks=50, seed=0):
+    """Time `ticks` ticks of one case. An animal update is one animal alive at the start of a tick."""
+    sim_config = config.SimConfig.from_dict(get_config(ticks=ticks, **case))
+
+    t0 = time.perf_counter()
+    env = environment.Environment(sim_config, seed)
+    setup_time = time.perf_counter() - t0
+
+    animal_updates = 0
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        animal_updates += env.mice_alive + env.owls_alive
+        env.tick()
+    seconds = time.perf_counter() - t0
+
+    return dict(case, ticks=ticks, setup_seconds=setup_time, seconds=seconds,
+                ticks_per_sec=ticks / seconds, animal_updates_per_sec=animal_updates / seconds)
+
+
+def run_sweep_benchmark(workers, jobs_per_worker=4, ticks=50, seed=0):
+    """Time a sweep of identical simulations through the sweep engine with the given number of workers."""
+    from . import automatic_testing
+    sim_config = config.SimConfig.from_dict(get_config(dimensions=30, density=0.3, rock_chance=0, grass_grow_back=5,
+                                                       ticks=ticks))
+    run = config.RunSettings(ticks)
+    jobs = [(str(i), sim_config, run, seed + i, None) for i in range(jobs_per_worker * workers)]
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for job_result in automatic_testing.run_in_pool(executor, jobs, 2 * workers):
+            pass
+    seconds = time.perf_counter() - t0
+
+    return {'workers': workers, 'jobs': len(jobs), 'ticks': ticks, 'seconds': seconds,
+            'jobs_per_sec': len(jobs) / seconds}
+
+
+def run_benchmarks(bench_matrix, ticks=50, worker_counts=(), log=print):
+    report = {'sim_version': environment.Environment.sim_version,
+              'python': platform.python_version(),
+              'platform': platform.platform(),
+              'cpu_count': os.cpu_count(),
+              'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'tick_benchmarks': [],
+              'sweep_benchmarks': []}
+
+    for values in product(*bench_matrix.values()):
+        result = run_tick_benchmark(dict(zip(bench_matrix, values)), ticks)
+        report['tick_benchmarks'].append(result)
+        log(f"{get_case_key(result):<60} {result['ticks_per_sec']:>9.1f} ticks/s "
+            f"{result['animal_updates_per_sec']:>11.0f} animal updates/s")
+
+    for workers in worker_counts:
+        result = run_sweep_benchmark(workers, ticks=ticks)
+        result['speedup'] = result['jobs_per_sec'] / report['sweep_benchmarks'][0]['jobs_per_sec'] \
+            if report['sweep_benchmarks'] else 1.0
+        report['sweep_benchmarks'].append(result)
+        log(f"{workers:>3} workers: {result['jobs_per_sec']:.2f} simulations/s, speedup {result['speedup']:.2f}")
+
+    return report
+
+
+def get_case_key(result):
+    return ', '.join(f'{key}={result[key]}' for key in matrix)
+
+
+def compare(baseline, report, tolerance=10):
+    """List the tick benchmarks that are more than tolerance percent slower than in baseline."""
+    # reports of versions with an array_world mode also hold its cases, which have no counterpart now
+    baseline_results = {get_case_key(result): result for result in baseline['tick_benchmarks']
+                        if not result.get('array_world')}
+    regressions = []
+    for result in report['tick_benchmarks']:
+        old_result = baseline_results.get(get_case_key(result))
+        if old_result and result['ticks_per_sec'] < old_result['ticks_per_sec'] * (1 - tolerance / 100):
+            regressions.append(f"{get_case_key(result)}: {old_result['ticks_per_sec']:.1f} -> "
+                               f"{result['ticks_per_sec']:.1f} ticks/s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark tick throughput and sweep scaling.')
+    parser.add_argument('--quick', action='store_true', help='run a small matrix')
+    parser.add_argument('--ticks', type=int, default=50, help='ticks per benchmark case')
+    parser.add_argument('--workers', type=int, nargs='*', default=[],
+                        help='worker counts for the sweep benchmark, e.g. --workers 1 2 4')
+    parser.add_argument('--output', help='write the report as JSON to this file')
+    parser.add_argument('--compare', help='JSON report of an earlier run to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=10, help='allowed slowdown in percent')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(quick_matrix if args.quick else matrix, args.ticks, args.workers)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(json.load(baseline_file), report, args.tolerance)
+        for regression in regressions:
+            print('Regression:', regression)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
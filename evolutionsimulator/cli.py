@@ -0,0 +1,112 @@
+import argparse
+import os
+import sys
+
+# Each command imports what it needs when it runs, so e.g. `run` never loads tkinter, psutil or termcolor.
+
+
+def run(args, parser):
+    """Run one simulation without drawing it and print how it ended."""
+    import configparser
+    import json
+    from . import config
+    from . import environment
+
+    config_parser = configparser.ConfigParser()
+    if not config_parser.read(args.config):
+        parser.error(f"can't read config file {args.config}")
+    auto_testing = config_parser['AUTO_TESTING'] if config_parser.has_section('AUTO_TESTING') else {}
+    ticks = args.ticks if args.ticks is not None else int(auto_testing.get('ticks', 100))
+    stop_when = args.stop_when if args.stop_when is not None else auto_testing.get('stop_when', 'extinction')
+    stop_when = [condition.strip() for condition in stop_when.split(',') if condition.strip()]
+
+    try:
+        env = environment.Environment(config.SimConfig.from_parser(config_parser), args.seed)
+        stop_tick = env.multiple_ticks(ticks, stop_when, int(auto_testing.get('plateau_ticks', 50)),
+                                       int(auto_testing.get('plateau_tolerance', 0)))
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.snapshot:
+        env.snapshot(args.snapshot)
+
+    avg_speed_mice, avg_speed_owls = env.average_speed()
+    if args.json:
+        print(json.dumps({'ticks': stop_tick, 'seed': env.seed, 'mice_alive': env.mice_alive,
+                          'owls_alive': env.owls_alive, 'avg_speed_mouse': avg_speed_mice,
+                          'avg_speed_owl': avg_speed_owls, 'births': env.births, 'deaths': env.deaths}))
+    else:
+        print(f"Ran {stop_tick} ticks with seed {env.seed}.\n"
+              f"Mice: {env.mice_alive}  Avg. speed: {avg_speed_mice}\n"
+              f"Owls: {env.owls_alive}  Avg. speed: {avg_speed_owls}")
+    return 0
+
+
+def sweep(args, parser):
+    from . import automatic_testing
+    automatic_testing.Tester(args.config or automatic_testing.cfg_file, assume_yes=args.yes).start()
+    return 0
+
+
+def worker(args, parser):
+    from . import work_queue
+    if not os.path.exists(args.queue):
+        parser.error(f'no work queue at {args.queue}')
+    finished = work_queue.run_worker(args.queue, poll_seconds=args.poll)
+    print(f'Worker finished {finished} simulations, the queue is empty.')
+    return 0
+
+
+def bench(bench_args):
+    from . import benchmark
+    return benchmark.main(bench_args)
+
+
+def start_gui():
+    from . import gui
+    gui.main()
+    return 0
+
+
+def main(argv=None):
+    """Entry point of `python -m evolutionsimulator` and `simulate`. Without a command the GUI starts."""
+    parser = argparse.ArgumentParser(prog='simulate', description='Simulate evolution of mice and owls.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+
+    run_parser = commands.add_parser('run', help='run one simulation headless and print the outcome')
+    run_parser.add_argument('config', help='config file, e.g. one of the interactive or automatic_testing configs')
+    run_parser.add_argument('--ticks', type=int, help='ticks to run (default: AUTO_TESTING ticks, else 100)')
+    run_parser.add_argument('--seed', type=int, help='seed of the simulation (default: a fresh one)')
+    run_parser.add_argument('--stop-when', help='comma-separated stop conditions (default: AUTO_TESTING '
+                                                'stop_when, else extinction)')
+    run_parser.add_argument('--snapshot', help='save the final state to this file for Environment.restore()')
+    run_parser.add_argument('--json', action='store_true', help='print the outcome as one JSON line')
+
+    sweep_parser = commands.add_parser('sweep', help='run a sweep over the config grid, like automatic_testing')
+    sweep_parser.add_argument('config', nargs='?', help='automatic_testing config file (default: mice_and_owls.ini)')
+    sweep_parser.add_argument('-y', '--yes', action='store_true', help='start without asking')
+
+    worker_parser = commands.add_parser('worker', help='run simulations from the work queue of a distributed sweep')
+    worker_parser.add_argument('queue', help='work queue file, the AUTO_TESTING queue setting of the sweep')
+    worker_parser.add_argument('--poll', type=float, default=2,
+                               help='seconds between looks at the queue while other workers finish (default 2)')
+
+    commands.add_parser('bench', help='benchmark the simulator, see `bench --help`', add_help=False)
+
+    args, extra_args = parser.parse_known_args(argv)
+    if args.command == 'bench':
+        return bench(extra_args)
+    if extra_args:
+        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
+
+    if args.command == 'run':
+        return run(args, run_parser)
+    if args.command == 'sweep':
+        return sweep(args, sweep_parser)
+    if args.command == 'worker':
+        return worker(args, worker_parser)
+    return start_gui()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
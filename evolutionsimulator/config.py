@@ -0,0 +1,158 @@
+import configparser
+import dataclasses
+import hashlib
+import json
+
+# (section, key in the config file, attribute, type, default). A setting without a default is required.
+settings = [('ENVIRONMENT', 'dimensions', 'dimensions', int, None),
+            ('ENVIRONMENT', 'rock_chance', 'rock_chance', int, None),
+            ('ENVIRONMENT', 'grass_grow_back', 'grass_grow_back', int, None),
+            ('MECHANICS', 'owls_target_slow_mice', 'owls_target_slow_mice', bool, False),
+            ('MECHANICS', 'rand_catch', 'rand_catch', bool, None),
+            ('MECHANICS', 'in_medias_res', 'in_medias_res', bool, None),
+            ('MICE', 'm_number', 'm_number', int, None),
+            ('MICE', 'm_die_of_hunger', 'm_die_of_hunger', int, None),
+            ('MICE', 'm_preg_time', 'm_preg_time', int, None),
+            ('MICE', 'm_max_age', 'm_max_age', int, None),
+            ('MICE', 'm_vision', 'm_vision', int, 1),
+            ('OWLS', 'o_number', 'o_number', int, None),
+            ('OWLS', 'o_die_of_hunger', 'o_die_of_hunger', int, None),
+            ('OWLS', 'o_preg_time', 'o_preg_time', int, None),
+            ('OWLS', 'o_max_age', 'o_max_age', int, None),
+            ('OWLS', 'o_vision', 'o_vision', int, 1),
+            ('INHERITANCE', 'rand_variance_trait', 'rand_variance_trait', int, None),
+            ('INHERITANCE', 'speed', 'inherit_speed', bool, None)]
+# attribute of every (section, key)
+attributes = {(section, key): attribute for section, key, attribute, kind, default in settings}
+
+
+@dataclasses.dataclass(frozen=True)
+class SimConfig:
+    """The settings of one simulation, parsed and validated once.
+
+    Immutable and hashable, so one instance can be shared by every environment and animal of a
+    run, shipped to worker processes and used as a key. Build it with from_parser() or
+    from_dict(); load() accepts either source or an existing SimConfig. Settings of other
+    sections, like AUTO_TESTING and TICK_TIME, are not part of it."""
+    dimensions: int
+    rock_chance: int
+    grass_grow_back: int
+    owls_target_slow_mice: bool
+    rand_catch: bool
+    in_medias_res: bool
+    m_number: int
+    m_die_of_hunger: int
+    m_preg_time: int
+    m_max_age: int
+    m_vision: int
+    o_number: int
+    o_die_of_hunger: int
+    o_preg_time: int
+    o_max_age: int
+    o_vision: int
+    rand_variance_trait: int
+    inherit_speed: bool
+
+    def __post_init__(self):
+        for attribute in ('rock_chance', 'grass_grow_back', 'm_number', 'm_die_of_hunger', 'm_preg_time', 'm_max_age',
+                          'o_number', 'o_die_of_hunger', 'o_preg_time', 'o_max_age', 'rand_variance_trait'):
+            if getattr(self, attribute) < 0:
+                raise ValueError(f'{attribute} must not be negative, got {getattr(self, attribute)}')
+        for attribute in ('dimensions', 'm_vision', 'o_vision'):
+            if getattr(self, attribute) < 1:
+                raise ValueError(f'{attribute} must be at least 1, got {getattr(self, attribute)}')
+        if self.rock_chance > 100:
+            raise ValueError(f'rock_chance is a percentage, got {self.rock_chance}')
+        if self.m_number + self.o_number > self.dimensions ** 2:
+            raise ValueError(f'{self.m_number} mice and {self.o_number} owls do not fit on a '
+                             f'{self.dimensions}x{self.dimensions} board')
+
+    @classmethod
+    def load(cls, source):
+        """SimConfig from a configparser.ConfigParser, a dict of sections or a SimConfig."""
+        if isinstance(source, SimConfig):
+            return source
+        if isinstance(source, configparser.ConfigParser):
+            return cls.from_parser(source)
+        return cls.from_dict(source)
+
+    @classmethod
+    def from_dict(cls, sections):
+        """SimConfig from a dict of sections of config file strings, e.g. {'MICE': {'m_number': '10', ...}, ...}."""
+        config_parser = configparser.ConfigParser()
+        config_parser.read_dict(sections)
+        return cls.from_parser(config_parser)
+
+    @classmethod
+    def from_parser(cls, config_parser):
+        values = {}
+        for section, key, attribute, kind, default in settings:
+            if not config_parser.has_option(section, key):
+                if default is None:
+                    raise ValueError(f'Missing setting {key} in section [{section}]')
+                values[attribute] = default
+                continue
+            try:
+                if kind is bool:
+                    values[attribute] = config_parser.getboolean(section, key)
+                else:
+                    values[attribute] = config_parser.getint(section, key)
+            except ValueError:
+                raise ValueError(f'Setting {key} in section [{section}] must be {kind.__name__}, '
+                                 f'got {config_parser[section][key]!r}') from None
+        return cls(**values)
+
+    def replace(self, **changes):
+        """Copy with some settings changed."""
+        return dataclasses.replace(self, **changes)
+
+    def values(self):
+        """Settings in the order of the settings table, e.g. for a results row."""
+        return [getattr(self, attribute) for section, key, attribute, kind, default in settings]
+
+    def to_dict(self):
+        """Settings as a dict of sections of config file strings, the inverse of from_dict()."""
+        sections = {}
+        for section, key, attribute, kind, default in settings:
+            sections.setdefault(section, {})[key] = str(getattr(self, attribute))
+        return sections
+
+    def key(self):
+        """Hex digest identifying these settings, stable across processes and runs."""
+        return hashlib.sha1(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class RunSettings:
+    """How every simulation of a sweep is run, from its AUTO_TESTING section: for how many ticks,
+    when it stops early, and what is recorded besides its results row."""
+    ticks: int
+    stop_when: tuple = ('extinction',)
+    plateau_ticks: int = 50
+    plateau_tolerance: int = 0
+    telemetry_every: int = 0
+    profile: bool = False
+
+    # the settings that change the outcome of a simulation, in the order of the results columns
+    columns = ['ticks', 'stop_when', 'plateau_ticks', 'plateau_tolerance']
+
+    def __post_init__(self):
+        object.__setattr__(self, 'stop_when', tuple(self.stop_when))
+
+    @classmethod
+    def from_section(cls, auto_testing):
+        """RunSettings from the AUTO_TESTING section of a configparser.ConfigParser."""
+        stop_when = [condition.strip() for condition in auto_testing.get('stop_when', 'extinction').split(',')
+                     if condition.strip()]
+        return cls(auto_testing.getint('ticks'), stop_when, auto_testing.getint('plateau_ticks', fallback=50),
+                   auto_testing.getint('plateau_tolerance', fallback=0),
+                   auto_testing.getint('telemetry_every', fallback=0),
+                   auto_testing.getboolean('profile', fallback=False))
+
+    def run_length(self):
+        """(ticks, stop_when, plateau_ticks, plateau_tolerance), the arguments of Environment.multiple_ticks."""
+        return self.ticks, list(self.stop_when), self.plateau_ticks, self.plateau_tolerance
+
+    def values(self):
+        """Values of the columns, e.g. for a results row."""
+        return [self.ticks, ', '.join(self.stop_when), self.plateau_ticks, self.plateau_tolerance]
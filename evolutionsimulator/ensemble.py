@@ -0,0 +1,93 @@
+from collections import deque
+import numpy as np
+from . import config
+from . import environment
+from . import population
+from . import randomness
+
+
+class Ensemble:
+    """Independent replicates of one config, advanced in lockstep.
+
+    All replicates keep their animals in one shared population store, tagged by replicate. Every
+    replicate is an Environment with a seed and random stream of its own: its animals act one at
+    a time and die on their own turn, and it grows grass from its own timing wheel. The mate
+    search, move resets and speed statistics run as single array operations over all
+    replicates, drawing each replicate's mate picks from its own stream, so a replicate ends
+    exactly like a separate run with its seed, whichever replicates run next to it.
+
+    Only those phases are batched; the animals' actions still cost the same as in separate runs.
+    Replicates that meet a stop condition are frozen while the others go on."""
+    def __init__(self, config_parser, replicates, seed=None, seeds=None):
+        """Set up the replicates, seeded with seeds, or with seeds drawn from seed."""
+        if seeds is None:
+            seed = randomness.new_seed() if seed is None else seed
+            seeds = randomness.RandomStream(seed).integers(0, 2 ** 63, replicates).tolist()
+
+        self.config = config.SimConfig.load(config_parser)
+        self.population = population.Population()
+        self.environments = [environment.Environment(self.config, replicate_seed, population_store=self.population,
+                                                     replicate=i)
+                             for i, replicate_seed in enumerate(seeds)]
+        self.rngs = [env.rng for env in self.environments]
+        self.dimensions = self.environments[0].dimensions
+        self.active = np.ones(replicates, dtype=bool)
+        self.stop_ticks = [None] * replicates
+
+    def __len__(self):
+        return len(self.environments)
+
+    def live_slots(self):
+        """Slots of the live animals in replicates that have not been stopped."""
+        pop = self.population
+        live = pop.live_slots()
+        return live[self.active[pop.replicate[live]]]
+
+    def tick(self):
+        active_environments = [env for env in self.environments if self.active[env.replicate]]
+        for env in active_environments:
+            env.owls_tick()
+            env.mice_tick()
+
+        live = self.live_slots()
+        self.population.mate_neighbours(live, self.population.replicate[live], len(self), self.dimensions,
+                                        environment.Environment.mate_directions, self.rngs)
+        self.population.has_moved[:self.population.size] = False
+        for env in active_environments:
+            env.grow_grass()
+            env.finish_tick()
+
+    def multiple_ticks(self, n, stop_when=(), plateau_ticks=50, plateau_tolerance=0):
+        """Run n ticks. A replicate that meets one of the stop_when conditions of
+        Environment.multiple_ticks is frozen. Returns the number of ticks run by each replicate."""
+        unknown_conditions = set(stop_when) - set(environment.Environment.stop_conditions)
+        if unknown_conditions:
+            raise ValueError(f"Unknown stop conditions: {', '.join(sorted(unknown_conditions))}")
+
+        histories = [deque(maxlen=plateau_ticks) for env in self.environments]
+        for i in range(n):
+            for env, history in zip(self.environments, histories):
+                if self.active[env.replicate] and env.is_stop_condition_met(stop_when, history, plateau_tolerance):
+                    self.active[env.replicate] = False
+                    self.stop_ticks[env.replicate] = i
+            if not self.active.any():
+                break
+
+            self.tick()
+            for env, history in zip(self.environments, histories):
+                if self.active[env.replicate]:
+                    history.append((env.mice_alive, env.owls_alive))
+
+        return [n if stop_tick is None else stop_tick for stop_tick in self.stop_ticks]
+
+    def average_speeds(self):
+        """[average mouse speed, average owl speed] of every replicate, 'N/A' where a species is gone."""
+        pop = self.population
+        live = pop.live_slots()
+        averages = []
+        for species in (population.MOUSE, population.OWL):
+            slots = live[pop.species[live] == species]
+            counts = np.bincount(pop.replicate[slots], minlength=len(self))
+            totals = np.bincount(pop.replicate[slots], weights=pop.speed[slots], minlength=len(self))
+            averages.append([int(total / count) if count else "N/A" for total, count in zip(totals, counts)])
+        return [list(replicate_averages) for replicate_averages in zip(*averages)]
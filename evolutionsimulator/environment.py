@@ -1,42 +1,50 @@
 from __future__ import annotations
-import animals as animals
-import copy
-from random import shuffle, randint
+import json
+from . import animals
+from . import config
+from . import population
+from . import randomness
+from . import rendering
+from . import spatial
+import numpy as np
+from collections import deque
+from itertools import permutations
 from typing import Tuple
-from termcolor import colored
+import os
 from os import system
 
 
-def restart_cursor():
-    print("\x1b[1;1H")
-
-
-def clear_screen():
-    print("\x1b[2J")
-
-
 class Tile:
-    def __init__(self, x: int, y: int, env: Environment):
+    def __init__(self, x: int, y: int, env: Environment, random_regrowth=True):
         self.env = env
         self.position = (x, y)
         self.rock = False
         self.animal = None
         self.grass = False
 
-        if env.in_medias_res:
-            self.time_since_grass_eaten = randint(0, self.env.grass_grow_back)
+        # grass_clock value at which the grass grows back, see Environment.grow_grass
+        if env.in_medias_res and random_regrowth:
+            self.regrow_at = self.env.grass_grow_back - self.env.rng.randint(0, self.env.grass_grow_back)
         else:
-            self.time_since_grass_eaten = 0
+            self.regrow_at = self.env.grass_grow_back
+
+    @property
+    def time_since_grass_eaten(self):
+        return self.env.grass_clock + self.env.grass_grow_back - self.regrow_at
+
+    @time_since_grass_eaten.setter
+    def time_since_grass_eaten(self, value):
+        self.env.schedule_regrowth(self, value)
 
     def __str__(self):
         if self.rock:
-            return colored("[" + "-"*(self.env.field_size - 2) + "]", color='white')
+            return rendering.colored("[" + "-"*(self.env.field_size - 2) + "]", color='white')
         elif self.animal and self.grass:
             return self.animal.__str__()
         elif self.animal and not self.grass:
             return self.animal.__str__()
         elif not self.animal and self.grass:
-            return colored("M" * self.env.field_size, color='green')
+            return rendering.colored("M" * self.env.field_size, color='green')
         else:
             return ' ' * self.env.field_size
 
@@ -44,33 +52,84 @@ class Tile:
 class Environment:
     sim_version = 1.00
     field_size = 3
+    stop_conditions = ('extinction', 'mice_extinct', 'owls_extinct', 'plateau')
+    # every ordering of n neighbours, so a random ordering costs a single draw
+    orderings = [list(permutations(range(n))) for n in range(len(animals.Animal.dir_options) + 1)]
+    # cells where a female finds a mate: the neighbouring cells, not her own
+    mate_directions = [x_y for x_y in animals.Animal.dir_options if x_y != (0, 0)]
+
+    snapshot_version = 1
 
-    def __init__(self, config_parser):
+    def __init__(self, config_parser, seed=None, populate=True, population_store=None, replicate=0):
+        """Set up an environment from a config, a config.SimConfig or anything SimConfig.load() takes.
+        Without populate the world is left empty, for restore().
+
+        An ensemble.Ensemble passes the population_store shared by its replicates, and the number of
+        this replicate in it."""
         self.sim_version = Environment.sim_version
+        self.seed = randomness.new_seed() if seed is None else seed
+        self.rng = randomness.RandomStream(self.seed)
         self.field_size = Environment.field_size
-        self.config_parser = config_parser
-        self.start_mice = int(self.config_parser['MICE']['m_number'])
-        self.start_owls = int(self.config_parser['OWLS']['o_number'])
-        self.dimensions = int(self.config_parser['ENVIRONMENT']['dimensions'])
-        self.grass_grow_back = int(self.config_parser['ENVIRONMENT']['grass_grow_back'])
-        self.rock_chance = int(self.config_parser['ENVIRONMENT']['rock_chance'])
-        self.in_medias_res = self.config_parser['MECHANICS'].getboolean('in_medias_res')
-        self.rand_catch = self.config_parser['MECHANICS'].getboolean('rand_catch')
-        self.rand_variance_trait = int(self.config_parser['INHERITANCE']['rand_variance_trait'])
-        self.owls_target_slow_mice = self.config_parser['MECHANICS'].getboolean('owls_target_slow_mice')
-
-        self.mice = []
-        self.owls = []
+        self.config = config.SimConfig.load(config_parser)
+        self.start_mice = self.config.m_number
+        self.start_owls = self.config.o_number
+        self.dimensions = self.config.dimensions
+        self.grass_grow_back = self.config.grass_grow_back
+        self.rock_chance = self.config.rock_chance
+        self.in_medias_res = self.config.in_medias_res
+        self.rand_catch = self.config.rand_catch
+        self.rand_variance_trait = self.config.rand_variance_trait
+        self.owls_target_slow_mice = self.config.owls_target_slow_mice
+        self.inherit_speed = self.config.inherit_speed
+        self.m_die_of_hunger = self.config.m_die_of_hunger
+        self.m_preg_time = self.config.m_preg_time
+        self.m_max_age = self.config.m_max_age
+        self.o_die_of_hunger = self.config.o_die_of_hunger
+        self.o_preg_time = self.config.o_preg_time
+        self.o_max_age = self.config.o_max_age
+        self.m_vision = self.config.m_vision
+        self.o_vision = self.config.o_vision
+        # timing wheel of tiles whose grass grows back, one bucket per grow_grass call of the next
+        # grass_grow_back + 1 ticks. grass_clock counts the grow_grass calls so far.
+        self.grass_clock = 0
+        self.regrowth_wheel = [[] for i in range(self.grass_grow_back + 1)]
+
+        self.mice = population.AnimalList()
+        self.owls = population.AnimalList()
         self.tick_no = 0
         self.step_no = 0
-
-        self.tiles = [[Tile(x, y, self) for x in range(self.dimensions)] for y in range(self.dimensions)]
+        self.shared_population = population_store is not None
+        self.population = population_store if self.shared_population else population.Population()
+        self.replicate = replicate
+        self.observers = []
+        # set to a profiling.Profiler to time the tick phases and count action branches
+        self.profiler = None
+        # rendering.TerminalRenderer drawing the interactive mode, set up by print_initial_board
+        self.renderer = None
+        # the tick_steps generator of a tick that step mode has started
+        self.steps = None
+        # running totals per species, indexed by population.MOUSE and population.OWL
+        self.births = [0, 0]
+        self.deaths = {'hunger': [0, 0], 'age': [0, 0], 'eaten': [0, 0]}
+        self.neighbours = []
+        # only needed when animals see further than their neighbouring tiles
+        self.spatial_index = spatial.SpatialIndex(self.dimensions) if max(self.m_vision, self.o_vision) > 1 else None
+
+        # a restored world gets its regrowth times from the snapshot, so none are drawn for it
+        self.tiles = [[Tile(x, y, self, populate) for x in range(self.dimensions)] for y in range(self.dimensions)]
         self.mice_alive = 0
         self.owls_alive = 0
 
         # INITIALIZE
-        self.add_animals()
-        self.add_grass_and_rocks()
+        if populate:
+            self.add_animals()
+            self.add_grass_and_rocks()
+            self.schedule_initial_regrowth()
+            self.build_neighbour_table()
+
+    def add_observer(self, observer):
+        """Call observer(env) after every tick, e.g. a telemetry.TelemetryRecorder."""
+        self.observers.append(observer)
 
     def set_console_size(self):
         console_width = max(6*self.dimensions+8, 50)
@@ -78,26 +137,37 @@ class Environment:
 
         system(f'mode con: cols={console_width} lines={console_height}')
 
-    def add_animal_at(self, animal: str, tile: Tile, parents=None):
+    def remove_animal(self, animal: animals.Animal, cause=None):
+        if cause:
+            self.deaths[cause][animal.species] += 1
+        if isinstance(animal, animals.Mouse):
+            self.mice.remove(animal)
+            self.mice_alive -= 1
+        else:
+            self.owls.remove(animal)
+            self.owls_alive -= 1
+        self.clear_field_of_animal(animal)
+        self.population.remove(animal.slot)
+
+    def add_animal_at(self, animal: str, tile: Tile, mother=None):
         if animal == "mouse":
-            new_mouse = animals.Mouse(tile.position, parents, self)
+            new_mouse = animals.Mouse(tile.position, mother, self)
             self.mice.append(new_mouse)
             tile.animal = new_mouse
-            tile.animal.grass = False  # TODO: hmm
-            tile.animal.time_since_grass_eaten = 0
             self.mice_alive += 1
 
         if animal == "owl":
-            new_owl = animals.Owl(tile.position, parents, self)
+            new_owl = animals.Owl(tile.position, mother, self)
             self.owls.append(new_owl)
             tile.animal = new_owl
-            tile.animal.grass = False  # TODO: Hmm
-            tile.animal.time_since_grass_eaten = 0
             self.owls_alive += 1
 
+        if self.spatial_index:
+            self.spatial_index.add(tile.animal.species, tile.position)
+
     def add_animals(self):
         tile_list = [self.tiles[y][x] for x in range(self.dimensions) for y in range(self.dimensions)]
-        shuffle(tile_list)
+        self.rng.shuffle(tile_list)
 
         for i in range(self.start_mice):
             self.add_animal_at("mouse", tile_list[i])
@@ -109,7 +179,7 @@ class Environment:
         for row in self.tiles:
             for tile in row:
                 if not tile.animal:
-                    rand_int = randint(1, 100)
+                    rand_int = self.rng.randint(1, 100)
                     if rand_int <= self.rock_chance:
                         tile.rock = True
                     else:
@@ -123,10 +193,37 @@ class Environment:
         x, y = x_y
         return (0 <= x < self.dimensions) and (0 <= y < self.dimensions)
 
+    def build_neighbour_table(self):
+        """Precompute the tiles an animal can reach from each cell, indexed by y*dimensions + x.
+
+        Rocks never change after add_grass_and_rocks, so this is done once per environment."""
+        dimensions = self.dimensions
+        rocks = np.array([[tile.rock for tile in row] for row in self.tiles], dtype=bool)
+
+        # index of the tile in each direction, or -1 where it is off the board or a rock
+        y, x = np.divmod(np.arange(dimensions * dimensions), dimensions)
+        adj_cells = np.full((dimensions * dimensions, len(animals.Animal.dir_options)), -1, dtype=np.int64)
+        for i, (x_move, y_move) in enumerate(animals.Animal.dir_options):
+            adj_x, adj_y = x + x_move, y + y_move
+            legal = (0 <= adj_x) & (adj_x < dimensions) & (0 <= adj_y) & (adj_y < dimensions)
+            adj_cell = np.where(legal, adj_y * dimensions + adj_x, 0)
+            adj_cells[:, i] = np.where(legal & ~rocks.flat[adj_cell], adj_cell, -1)
+
+        flat_tiles = [tile for row in self.tiles for tile in row]
+        self.neighbours = [tuple([flat_tiles[cell] for cell in cells if cell >= 0]) for cells in adj_cells.tolist()]
+
+    def get_adj_legal_tiles(self, x_y: Tuple[int, int]):
+        """Reachable tiles around x_y in a random order."""
+        x, y = x_y
+        adj_tiles = self.neighbours[y*self.dimensions + x]
+        return [adj_tiles[i] for i in self.rng.choice(Environment.orderings[len(adj_tiles)])]
+
     def animal_move_to(self, animal: animals.Animal, dest_tile: Tile):
         self.clear_field_of_animal(animal)
         animal.position = dest_tile.position
         dest_tile.animal = animal
+        if self.spatial_index:
+            self.spatial_index.add(animal.species, dest_tile.position)
         if isinstance(animal, animals.Mouse):
             if dest_tile.grass:
                 dest_tile.grass = False
@@ -136,91 +233,261 @@ class Environment:
     def clear_field_of_animal(self, animal: animals.Animal):
         x, y = animal.position
         self.tiles[y][x].animal = None
+        if self.spatial_index:
+            self.spatial_index.remove(animal.species, (x, y))
 
-    def owls_tick(self, step_mode=False):
-        owls_copy = copy.copy(self.owls)
-        shuffle(owls_copy)
-        for owl in owls_copy:
+    def nearest_animal(self, species: int, x_y: Tuple[int, int], radius: int):
+        """Position of the closest animal of species within radius moves of x_y, or None."""
+        return self.spatial_index.nearest(species, x_y, radius)
+
+    def owl_actions(self):
+        """Let the owls act in random order, pausing after each action."""
+        self.owls.shuffle(self.rng)
+        for owl in self.owls.activation_order():
             if not owl.has_moved:
                 owl.action()
-                if step_mode:
-                    self.print_board()
-                    return True
-
-    def mice_tick(self, step_mode=False):
-        mice_copy = copy.copy(self.mice)
-        mice_copy.sort(key=lambda animal_elm: animal_elm.speed, reverse=True)
-        for mouse in mice_copy:
+                yield owl
+
+    def mouse_actions(self):
+        """Let the mice act from fastest to slowest, pausing after each action."""
+        self.mice.sort(key=lambda animal_elm: animal_elm.speed, reverse=True)
+        for mouse in self.mice.activation_order():
             if not mouse.has_moved:
                 mouse.action()
                 mouse.post_action()
-                if step_mode:
-                    self.print_board()
-                    return True
+                yield mouse
+
+    def owls_tick(self):
+        for owl in self.owl_actions():
+            pass
+
+    def mice_tick(self):
+        for mouse in self.mouse_actions():
+            pass
 
     def update_pregnancies(self):
-        for owl in self.owls:
-            if owl.sex == 'female' and not owl.is_pregnant:
-                male_tiles = owl.get_male_owl_tiles()
-                if male_tiles:
-                    owl.is_pregnant = True
-                    owl.is_pregnant_with = male_tiles[0].animal
-
-        for mouse in self.mice:
-            if mouse.sex == 'female' and not mouse.is_pregnant:
-                male_tiles = mouse.get_male_mouse_tiles()
-                if male_tiles:
-                    mouse.is_pregnant = True
-                    mouse.is_pregnant_with = male_tiles[0].animal
+        """Make every female that is not pregnant pregnant by a male of her species next to her.
+
+        Works on the positions after this tick's moves, for all animals at once."""
+        live = self.population.live_slots(replicate=self.replicate)
+        self.population.mate_neighbours(live, np.zeros(live.size, dtype=np.int64), 1, self.dimensions,
+                                        Environment.mate_directions, [self.rng])
 
     def reset_moves(self):
-        for mouse in self.mice:
-            mouse.has_moved = False
+        self.population.has_moved[:self.population.size] = False
 
-        for owl in self.owls:
-            owl.has_moved = False
+    def schedule_regrowth(self, tile: Tile, time_since_grass_eaten: int):
+        """Let the grass of tile grow back once time_since_grass_eaten exceeds grass_grow_back."""
+        tile.regrow_at = self.grass_clock + max(self.grass_grow_back - time_since_grass_eaten, 0)
+        self.regrowth_wheel[tile.regrow_at % len(self.regrowth_wheel)].append(tile)
 
-    def grow_grass(self):
+    def schedule_initial_regrowth(self):
         for row in self.tiles:
             for tile in row:
-                if not tile.rock:
-                    tile.time_since_grass_eaten += 1
-                    if tile.time_since_grass_eaten > self.grass_grow_back:
-                        tile.grass = True
+                if not tile.rock and not tile.grass:
+                    self.regrowth_wheel[tile.regrow_at % len(self.regrowth_wheel)].append(tile)
+
+    def grow_grass(self):
+        """Grow back the grass of the tiles due at this tick. Only tiles that were grazed are visited."""
+        bucket_no = self.grass_clock % len(self.regrowth_wheel)
+        bucket = self.regrowth_wheel[bucket_no]
+        self.regrowth_wheel[bucket_no] = []
+        for tile in bucket:
+            # skip tiles rescheduled to a later tick
+            if tile.regrow_at == self.grass_clock and not tile.rock:
+                tile.grass = True
+        self.grass_clock += 1
 
     def tick(self):
-        self.owls_tick()
-        self.mice_tick()
+        if self.steps is not None:
+            # finish the tick already started in step mode
+            for animal in self.steps:
+                pass
+            self.steps = None
+            return
+
+        if self.profiler:
+            for phase in (self.owls_tick, self.mice_tick, self.update_pregnancies, self.reset_moves, self.grow_grass):
+                self.profiler.time_phase(phase)
+            self.profiler.ticks += 1
+        else:
+            self.owls_tick()
+            self.mice_tick()
+            self.update_pregnancies()
+            self.reset_moves()
+            self.grow_grass()
+        self.finish_tick()
+
+    def tick_steps(self):
+        """Run one tick as a generator that pauses after every animal's action.
+
+        The activation order is set up once per phase, exactly as in tick(), so stepping
+        through a tick gives the same trajectory as running it at once."""
+        yield from self.owl_actions()
+        yield from self.mouse_actions()
         self.update_pregnancies()
         self.reset_moves()
         self.grow_grass()
+        self.finish_tick()
+
+    def finish_tick(self):
+        self.population.recycle()
         self.tick_no += 1
         self.step_no = 0
+        for observer in self.observers:
+            observer(self)
 
     def step(self):
+        """Let the next animal act. The step after the last action of a tick finishes the tick."""
+        if self.steps is None:
+            self.steps = self.tick_steps()
         self.step_no += 1
-        if not self.owls_tick(step_mode=True):
-            if not self.mice_tick(step_mode=True):
-                self.update_pregnancies()
-                self.reset_moves()
-                self.grow_grass()
-                self.tick_no += 1
-                self.step_no = 0
-                self.print_board()
-
-    def multiple_ticks(self, n):
+        for animal in self.steps:
+            return
+        self.steps = None
+
+    def snapshot(self, file, compressed=True):
+        """Save the full state of the environment to file, a path or a binary file object.
+        A path is used as it is; unlike np.savez, no .npz is appended to it.
+
+        The snapshot holds the config, the world and population arrays, the activation order,
+        the counters and the state of the random stream, so restore() continues exactly where
+        the environment left off."""
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'wb') as f:
+                return self.snapshot(f, compressed)
+
+        if self.steps is not None:
+            raise ValueError("Can't take a snapshot in the middle of a tick started in step mode")
+        if self.shared_population:
+            raise ValueError("Can't take a snapshot of a single replicate of an ensemble")
+
+        pop = self.population
+        rng_state = self.rng.get_state()
+        rng_batch = np.array(rng_state.pop('batch'), dtype=np.float64)
+        state = {'format': 'evolutionsimulator-snapshot',
+                 'snapshot_version': Environment.snapshot_version,
+                 'sim_version': self.sim_version,
+                 'config': self.config.to_dict(),
+                 'seed': self.seed,
+                 'rng': rng_state,
+                 'counters': {'tick_no': self.tick_no, 'grass_clock': self.grass_clock, 'field_size': self.field_size,
+                              'births': self.births, 'deaths': self.deaths, 'size': pop.size,
+                              'next_id': pop.next_id, 'free_slots': pop.free_slots,
+                              'released_slots': pop.released_slots}}
+
+        rocks = np.array([[tile.rock for tile in row] for row in self.tiles])
+        grass = np.array([[tile.grass for tile in row] for row in self.tiles])
+        regrow_at = np.array([[tile.regrow_at for tile in row] for row in self.tiles])
+
+        arrays = {'pop_' + name: getattr(pop, name)[:pop.size] for name in population.Population.fields}
+        save = np.savez_compressed if compressed else np.savez
+        save(file, state=np.array(json.dumps(state)), rocks=rocks, grass=grass, regrow_at=regrow_at, rng_batch=rng_batch,
+             mice_order=np.array([mouse.slot for mouse in self.mice], dtype=np.int64),
+             owls_order=np.array([owl.slot for owl in self.owls], dtype=np.int64), **arrays)
+
+    @classmethod
+    def restore(cls, file, seed=None):
+        """Load an environment saved by snapshot().
+
+        Given a seed, the restored environment draws fresh randomness from that seed instead of
+        continuing the saved stream, which forks independent runs from one saved state."""
+        with np.load(file) as data:
+            state = json.loads(str(data['state']))
+            if state.get('format') != 'evolutionsimulator-snapshot':
+                raise ValueError('Not an environment snapshot')
+            if state['snapshot_version'] > Environment.snapshot_version:
+                raise ValueError(f"Snapshot version {state['snapshot_version']} is newer than this simulator")
+            if state['sim_version'] != Environment.sim_version:
+                raise ValueError(f"Snapshot of sim version {state['sim_version']} can't be run by sim version "
+                                 f"{Environment.sim_version}")
+            arrays = {name: data[name] for name in data.files if name != 'state'}
+
+        env = cls(config.SimConfig.from_dict(state['config']), state['seed'] if seed is None else seed, populate=False)
+        if seed is None:
+            env.rng.set_state(dict(state['rng'], batch=arrays['rng_batch'].tolist()))
+
+        counters = state['counters']
+        env.tick_no = counters['tick_no']
+        env.grass_clock = counters['grass_clock']
+        env.field_size = counters['field_size']
+        env.births = counters['births']
+        env.deaths = counters['deaths']
+
+        pop = env.population
+        while pop.capacity < counters['size']:
+            pop.grow()
+        for name in population.Population.fields:
+            getattr(pop, name)[:counters['size']] = arrays['pop_' + name]
+        pop.size = counters['size']
+        pop.next_id = counters['next_id']
+        pop.free_slots = counters['free_slots']
+        pop.released_slots = counters['released_slots']
+
+        # pending regrowth follows from the grass clock, so the timing wheel is rebuilt
+        wheel = env.regrowth_wheel
+        pending = ~arrays['rocks'] & ~arrays['grass'] & (arrays['regrow_at'] >= env.grass_clock)
+        for row, rock_row, grass_row, regrow_row, pending_row in zip(
+                env.tiles, arrays['rocks'].tolist(), arrays['grass'].tolist(), arrays['regrow_at'].tolist(),
+                pending.tolist()):
+            for tile, rock, grass, regrow_at, is_pending in zip(row, rock_row, grass_row, regrow_row, pending_row):
+                tile.rock, tile.grass, tile.regrow_at = rock, grass, regrow_at
+                if is_pending:
+                    wheel[regrow_at % len(wheel)].append(tile)
+        env.build_neighbour_table()
+
+        for animal_class, animal_list, order in ((animals.Mouse, env.mice, arrays['mice_order']),
+                                                 (animals.Owl, env.owls, arrays['owls_order'])):
+            for slot in order.tolist():
+                animal = animal_class.from_slot(env, slot)
+                animal_list.append(animal)
+                env.tiles[pop.y[slot]][pop.x[slot]].animal = animal
+                if env.spatial_index:
+                    env.spatial_index.add(animal.species, animal.position)
+        env.mice_alive = len(env.mice)
+        env.owls_alive = len(env.owls)
+
+        return env
+
+    def multiple_ticks(self, n, stop_when=(), plateau_ticks=50, plateau_tolerance=0):
+        """Run n ticks, or stop early once one of the stop_when conditions is met:
+            'extinction'   - no animals are left
+            'mice_extinct' - no mice are left
+            'owls_extinct' - no owls are left
+            'plateau'      - for the last plateau_ticks ticks, the number of both mice and owls
+                             stayed within plateau_tolerance percent of its maximum
+        Returns the number of ticks run."""
+        unknown_conditions = set(stop_when) - set(Environment.stop_conditions)
+        if unknown_conditions:
+            raise ValueError(f"Unknown stop conditions: {', '.join(sorted(unknown_conditions))}")
+
+        history = deque(maxlen=plateau_ticks)
         for i in range(n):
+            if self.is_stop_condition_met(stop_when, history, plateau_tolerance):
+                return i
             self.tick()
+            history.append((self.mice_alive, self.owls_alive))
+        return n
+
+    def is_stop_condition_met(self, stop_when, history, plateau_tolerance):
+        if 'extinction' in stop_when and self.mice_alive == 0 and self.owls_alive == 0:
+            return True
+        if 'mice_extinct' in stop_when and self.mice_alive == 0:
+            return True
+        if 'owls_extinct' in stop_when and self.owls_alive == 0:
+            return True
+        if 'plateau' in stop_when and history and len(history) == history.maxlen:
+            for counts in zip(*history):
+                if max(counts) - min(counts) > max(counts) * plateau_tolerance / 100:
+                    return False
+            return True
+        return False
 
     def average_speed(self):
-        total_speed_mice = 0
-        total_speed_owls = 0
-
-        for mouse in self.mice:
-            total_speed_mice += mouse.speed
-
-        for owl in self.owls:
-            total_speed_owls += owl.speed
+        total_speed_mice = int(self.population.speed[self.population.live_slots(population.MOUSE,
+                                                                                 self.replicate)].sum())
+        total_speed_owls = int(self.population.speed[self.population.live_slots(population.OWL,
+                                                                                 self.replicate)].sum())
 
         if self.mice_alive > 0:
             avg_speed_mice = int(total_speed_mice/self.mice_alive)
@@ -234,9 +501,14 @@ class Environment:
 
         return [avg_speed_mice, avg_speed_owls]
 
+    def grass_coverage(self):
+        """Fraction of the non-rock tiles that currently have grass."""
+        soil_tiles = [tile for row in self.tiles for tile in row if not tile.rock]
+        return sum(tile.grass for tile in soil_tiles) / len(soil_tiles) if soil_tiles else 0.0
+
     def print_board(self):
-        print(" " + colored(f"Tick: {str(self.tick_no).ljust(5)}  Step: {str(self.step_no).ljust(3)}",
-                            attrs=['underline']))
+        print(" " + rendering.colored(f"Tick: {str(self.tick_no).ljust(5)}  Step: {str(self.step_no).ljust(3)}",
+                                      attrs=['underline']))
         print()
         print(" "*4, end='')
         for i in range(self.dimensions):
@@ -255,32 +527,23 @@ class Environment:
         print()
 
     def print_controls(self):
-        print(' '+colored('Controls:', attrs=['underline']))
-        print(" Space       -> Advance the simulation")
-        print(" Right arrow -> Increase simulation speed")
-        print(" Left arrow  -> Decrease simulation speed")
-        print(" S           -> Enable step-mode")
-        print(" T           -> enable tick-mode")
-        print(" R           -> Restart simulation")
-        print(" Q           -> Quit simulation")
+        print(' '+rendering.colored('Controls:', attrs=['underline']))
+        for line in rendering.controls:
+            print(line)
 
     def print_board_and_stats(self):
         self.print_board()
         self.print_stats()
 
     def tick_and_print(self):
-        restart_cursor()
         self.tick()
-        self.print_board_and_stats()
+        self.renderer.draw()
 
     def step_and_print(self):
-        restart_cursor()
         self.step()
-        self.print_stats()
+        self.renderer.draw()
 
     def print_initial_board(self):
         self.set_console_size()
-        clear_screen()
-        restart_cursor()
-        self.print_board_and_stats()
-        self.print_controls()
+        self.renderer = rendering.TerminalRenderer(self)
+        self.renderer.draw(full=True)
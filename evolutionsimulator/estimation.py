@@ -0,0 +1,93 @@
+import sys
+import time
+import numpy as np
+from . import environment
+
+
+class CostModel:
+    """Predicts how long a simulation takes from its board size and starting population.
+
+    calibrate() times the setup and a few ticks of some sample configs and fits
+    seconds = a + b * tiles + c * animals to them by least squares. A prediction ignores
+    stop conditions, so a sweep that stops early takes less time than estimated."""
+    def __init__(self, sample_ticks=5):
+        self.sample_ticks = sample_ticks
+        self.coefficients = None
+        self.min_seconds = 0
+
+    @staticmethod
+    def features(dimensions, animals):
+        dimensions, animals = np.asarray(dimensions, dtype=float), np.asarray(animals, dtype=float)
+        return np.stack([np.ones_like(dimensions), dimensions ** 2, animals], axis=-1)
+
+    def calibrate(self, sim_configs, ticks):
+        """Fit the model to the sample config.SimConfig sim_configs, each run for ticks ticks."""
+        seconds = []
+        for i, sim_config in enumerate(sim_configs):
+            t0 = time.perf_counter()
+            env = environment.Environment(sim_config, seed=i)
+            setup_seconds = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for tick in range(self.sample_ticks):
+                env.tick()
+            tick_seconds = (time.perf_counter() - t0) / self.sample_ticks
+            seconds.append(setup_seconds + ticks * tick_seconds)
+
+        features = self.features([sim_config.dimensions for sim_config in sim_configs],
+                                 [sim_config.m_number + sim_config.o_number for sim_config in sim_configs])
+        self.coefficients = np.linalg.lstsq(features, np.array(seconds), rcond=None)[0]
+        # a fit through few points can dip below anything that was measured
+        self.min_seconds = min(seconds)
+
+    def predict(self, dimensions, animals):
+        """Seconds per simulation for boards of the given dimensions holding animals at the start."""
+        return np.maximum(self.features(dimensions, animals) @ self.coefficients, self.min_seconds)
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f'{seconds}s'
+    if seconds < 3600:
+        return f'{seconds // 60}m {seconds % 60:02d}s'
+    return f'{seconds // 3600}h {seconds // 60 % 60:02d}m'
+
+
+class Progress:
+    """Reports finished simulations and the time left, from the throughput observed so far.
+
+    On a terminal the report line is rewritten in place at most every interval seconds;
+    otherwise, e.g. in the log of a cluster job, a new line is printed every log_interval
+    seconds. Until the first simulation finishes, the time left is the estimate given."""
+    def __init__(self, total, estimate=None, out=None, interval=1, log_interval=60, clock=time.monotonic):
+        self.total = total
+        self.done = 0
+        self.estimate = estimate
+        self.out = out or sys.stdout
+        self.in_place = self.out.isatty()
+        self.interval = interval if self.in_place else log_interval
+        self.clock = clock
+        self.start = clock()
+        self.last_report = None
+
+    def seconds_left(self):
+        if not self.done:
+            return self.estimate
+        return (self.clock() - self.start) / self.done * (self.total - self.done)
+
+    def text(self):
+        rate = self.done / max(self.clock() - self.start, 1e-9) * 60
+        seconds_left = self.seconds_left()
+        eta = format_duration(seconds_left) if seconds_left is not None else '?'
+        return f'{self.done}/{self.total} simulations done, {rate:.1f} per minute, about {eta} left'
+
+    def update(self, n=1):
+        self.done += n
+        now = self.clock()
+        if self.last_report is None or now - self.last_report >= self.interval or self.done == self.total:
+            self.last_report = now
+            if self.in_place:
+                self.out.write('\r' + self.text() + '\x1b[K')
+            else:
+                self.out.write(self.text() + '\n')
+            self.out.flush()
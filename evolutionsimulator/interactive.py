@@ -1,19 +1,27 @@
-import pkg_resources
-import environment as environment
+from . import config
+from . import environment
+from . import paths
 import keyboard
 import time
 import cursor
 from os import system
 import configparser
+import threading
 import sys
 
 #########################
 # CHOOSE A CONFIG FILE TO BE USED WHEN FILE RUN DIRECTLY:
-cfg_file = pkg_resources.resource_filename('evolutionsimulator', 'configs/interactive/mice_and_owls.ini')
+cfg_file = paths.package_path('configs', 'interactive', 'mice_and_owls.ini')
 ##########################
 
 
 class InteractiveSimulator:
+    """Runs the simulation, the drawing of the board and the keyboard input independently.
+
+    A simulation thread ticks while space is held, either at one tick per slow_mode_sleep_time
+    or as fast as it can. The main thread draws the latest state at a fixed frame rate, and
+    key presses arrive as keyboard events, so nothing is polled and a paused simulation
+    sleeps until it is told to go on."""
     def __init__(self, cfg_file_string):
         self.slow_mode = True
         self.step_mode = False
@@ -24,42 +32,81 @@ class InteractiveSimulator:
         self.config_parser = configparser.ConfigParser()
         self.config_parser.read(self.cfg_file_string)
         self.slow_mode_sleep_time = float(self.config_parser['TICK_TIME']['slow_mode_sleep_time'])
+        self.frame_time = 1 / float(self.config_parser['TICK_TIME'].get('fps', 20))
+        self.sim_config = config.SimConfig.from_parser(self.config_parser)
+
+        self.lock = threading.Lock()
+        self.advancing = threading.Event()
+        self.quit = threading.Event()
+        self.restart = False
+        self.changed = False
 
         self.start_simulation()
 
     def start_simulation(self):
-        self.env = environment.Environment(self.config_parser)
+        self.env = environment.Environment(self.sim_config)
         self.env.print_initial_board()
 
-        while True:
-            if keyboard.is_pressed('space'):
-                if not self.step_mode:
-                    self.env.tick_and_print()
+        keyboard.on_press(self.on_press)
+        keyboard.on_release_key('space', lambda event: self.advancing.clear())
+        simulation_thread = threading.Thread(target=self.simulate, daemon=True)
+        simulation_thread.start()
+        try:
+            self.render()
+        finally:
+            self.quit.set()
+            self.advancing.set()
+            simulation_thread.join()
+            keyboard.unhook_all()
+
+    def on_press(self, event):
+        if event.name == 'space':
+            self.advancing.set()
+        elif event.name == 'left':
+            self.slow_mode = True
+        elif event.name == 'right':
+            self.slow_mode = False
+        elif event.name == 'r':
+            self.restart = True
+        elif event.name == 's':
+            self.step_mode = True
+        elif event.name == 't':
+            self.step_mode = False
+        elif event.name == 'q':
+            self.quit.set()
+            self.advancing.set()
+
+    def simulate(self):
+        """Tick or step while space is held, as fast as possible or at the slow-mode rate."""
+        while self.advancing.wait() and not self.quit.is_set():
+            t0 = time.perf_counter()
+            with self.lock:
+                if self.step_mode:
+                    self.env.step()
                 else:
-                    self.env.step_and_print()
-
-            elif keyboard.is_pressed('left'):
-                self.slow_mode = True
-
-            elif keyboard.is_pressed('right'):
-                self.slow_mode = False
-
-            elif keyboard.is_pressed('r'):
-                self.start_simulation()
-
-            elif keyboard.is_pressed('s'):
-                self.step_mode = True
-
-            elif keyboard.is_pressed('t'):
-                self.step_mode = False
-
-            elif keyboard.is_pressed('q'):
-                break
+                    self.env.tick()
+                self.changed = True
 
             if self.slow_mode:
-                time.sleep(self.slow_mode_sleep_time)
-            elif not self.slow_mode and self.step_mode:
-                time.sleep(0.01)
+                pause = self.slow_mode_sleep_time
+            elif self.step_mode:
+                pause = 0.01
+            else:
+                continue
+            self.quit.wait(max(pause - (time.perf_counter() - t0), 0))
+
+    def render(self):
+        """Draw the latest state at most once per frame until the simulation is quit."""
+        while not self.quit.wait(self.frame_time):
+            with self.lock:
+                if self.restart:
+                    self.restart = False
+                    self.changed = False
+                    self.env = environment.Environment(self.sim_config)
+                    self.env.print_initial_board()
+                elif self.changed:
+                    self.changed = False
+                    self.env.renderer.draw()
 
 
 if __name__ == '__main__':
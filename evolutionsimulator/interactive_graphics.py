@@ -1,5 +1,5 @@
 import tkinter as tk
-import animals
+from . import animals
 #from PIL import Image
 
 class View:
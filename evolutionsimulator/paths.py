@@ -0,0 +1,15 @@
+import os
+
+
+def package_path(*parts):
+    """Path of a file or directory shipped with the package, e.g. package_path('configs', 'interactive')."""
+    try:
+        from importlib.resources import files
+    except ImportError:
+        # importlib.resources.files() is new in Python 3.9, before that the package is a plain directory
+        return os.path.join(os.path.dirname(__file__), *parts)
+
+    path = files(__package__)
+    for part in parts:
+        path = path / part
+    return str(path)
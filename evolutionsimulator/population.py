@@ -0,0 +1,197 @@
+import numpy as np
+
+MOUSE = 0
+OWL = 1
+NO_ANIMAL = -1
+
+
+class Population:
+    """Structure-of-arrays store holding the state of every animal in an environment.
+
+    Each field is a NumPy array indexed by slot. Slots of dead animals are handed out again
+    at the end of the tick, while every animal keeps a unique ID, so lineage is kept as
+    plain parent IDs instead of references to whole ancestor chains."""
+    fields = {'id': np.int64,
+              'species': np.int8,
+              'alive': np.bool_,
+              'x': np.int32,
+              'y': np.int32,
+              'speed': np.int32,
+              'sex': np.int8,
+              'age': np.int32,
+              'time_since_eaten': np.int32,
+              'is_pregnant': np.bool_,
+              'time_pregnant': np.int32,
+              'has_moved': np.bool_,
+              'mother_id': np.int64,
+              'father_id': np.int64,
+              'mate_id': np.int64,
+              'mate_speed': np.int32,
+              'replicate': np.int32}
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        for name, dtype in Population.fields.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.animals = [None] * capacity
+        self.size = 0
+        self.next_id = 0
+        self.free_slots = []
+        self.released_slots = []
+
+    def grow(self):
+        new_capacity = 2 * self.capacity
+        for name in Population.fields:
+            old_array = getattr(self, name)
+            new_array = np.zeros(new_capacity, dtype=old_array.dtype)
+            new_array[:self.capacity] = old_array
+            setattr(self, name, new_array)
+        self.animals.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def add(self, animal, species, x_y, speed, sex, time_since_eaten, parents=(NO_ANIMAL, NO_ANIMAL),
+            replicate=0) -> int:
+        """Store a new animal and return its slot."""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self.grow()
+            slot = self.size
+            self.size += 1
+
+        self.id[slot] = self.next_id
+        self.next_id += 1
+        self.species[slot] = species
+        self.alive[slot] = True
+        self.x[slot], self.y[slot] = x_y
+        self.speed[slot] = speed
+        self.sex[slot] = sex
+        self.age[slot] = 0
+        self.time_since_eaten[slot] = time_since_eaten
+        self.is_pregnant[slot] = False
+        self.time_pregnant[slot] = 0
+        self.has_moved[slot] = False
+        self.mother_id[slot], self.father_id[slot] = parents
+        self.mate_id[slot] = NO_ANIMAL
+        self.mate_speed[slot] = 0
+        self.replicate[slot] = replicate
+        self.animals[slot] = animal
+
+        return slot
+
+    def remove(self, slot):
+        """Mark an animal as dead. Its slot is not reused before recycle() is called."""
+        self.alive[slot] = False
+        self.animals[slot] = None
+        self.released_slots.append(slot)
+
+    def recycle(self):
+        self.free_slots.extend(self.released_slots)
+        self.released_slots.clear()
+
+    def live_slots(self, species=None, replicate=None):
+        alive = self.alive[:self.size]
+        if species is not None:
+            alive = alive & (self.species[:self.size] == species)
+        if replicate is not None:
+            alive = alive & (self.replicate[:self.size] == replicate)
+        return np.flatnonzero(alive)
+
+    def mate_neighbours(self, live, layers, layer_count, dimensions, directions, rngs):
+        """Make every female among the live slots that is not pregnant pregnant by a male of her
+        species on a neighbouring cell. When several males are next to her, one is picked at random.
+
+        layers gives the board, from 0 to layer_count - 1, that each live animal is on, so the
+        boards of many replicates are matched in one pass. The random picks on each board are drawn
+        from its own stream in rngs, for its females in ID order, so a board gets the same mates
+        whichever slots its animals hold and whichever other boards are matched with it."""
+        is_female = (self.sex[live] == 1) & ~self.is_pregnant[live]
+        females, female_layers = live[is_female], layers[is_female]
+        if not females.size:
+            return
+        order = np.lexsort((self.id[females], female_layers))
+        females, female_layers = females[order], female_layers[order]
+
+        # slot of the animal on every cell, with a border of empty cells around each board
+        occupants = np.full((layer_count, dimensions + 2, dimensions + 2), NO_ANIMAL, dtype=np.int64)
+        occupants[layers, self.y[live] + 1, self.x[live] + 1] = live
+
+        female_x, female_y = self.x[females] + 1, self.y[females] + 1
+        neighbours = np.stack([occupants[female_layers, female_y + y_move, female_x + x_move]
+                               for x_move, y_move in directions], axis=1)
+        occupied = neighbours != NO_ANIMAL
+        neighbour_slots = np.where(occupied, neighbours, 0)
+        is_mate = (occupied & (self.sex[neighbour_slots] == 0)
+                   & (self.species[neighbour_slots] == self.species[females][:, None]))
+
+        has_mate = is_mate.any(axis=1)
+        if not has_mate.any():
+            return
+        # females of a board are next to each other after sorting, and a board without any
+        # mates draws nothing, just like a board matched on its own
+        picks = np.full(is_mate.shape, -1.0)
+        bounds = np.searchsorted(female_layers, np.arange(layer_count + 1))
+        for layer in np.unique(female_layers[has_mate]).tolist():
+            start, stop = bounds[layer], bounds[layer + 1]
+            picks[start:stop] = rngs[layer].floats((stop - start, is_mate.shape[1]))
+        choice = np.argmax(np.where(is_mate, picks, -1), axis=1)
+        mothers = females[has_mate]
+        fathers = neighbours[has_mate, choice[has_mate]]
+        self.is_pregnant[mothers] = True
+        self.mate_id[mothers] = self.id[fathers]
+        self.mate_speed[mothers] = self.speed[fathers]
+
+
+class AnimalList:
+    """Live animals of one species in activation order, with constant-time removal.
+
+    Removing an animal leaves a tombstone in its place. Tombstones are compacted away when
+    the next activation order is set up, so a tick can walk the list without copying it."""
+    def __init__(self):
+        self.items = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def __bool__(self):
+        return bool(self.index)
+
+    def __contains__(self, animal):
+        return animal.ID in self.index
+
+    def __iter__(self):
+        return (animal for animal in self.items if animal is not None)
+
+    def append(self, animal):
+        self.index[animal.ID] = len(self.items)
+        self.items.append(animal)
+
+    def remove(self, animal):
+        self.items[self.index.pop(animal.ID)] = None
+
+    def compact(self):
+        if len(self.items) != len(self.index):
+            self.items[:] = [animal for animal in self.items if animal is not None]
+
+    def reindex(self):
+        self.index = {animal.ID: i for i, animal in enumerate(self.items)}
+
+    def shuffle(self, rng):
+        self.compact()
+        rng.shuffle(self.items)
+        self.reindex()
+
+    def sort(self, key, reverse=False):
+        self.compact()
+        self.items.sort(key=key, reverse=reverse)
+        self.reindex()
+
+    def activation_order(self):
+        """Yield the animals present when called, skipping those that die along the way."""
+        items = self.items
+        for i in range(len(items)):
+            animal = items[i]
+            if animal is not None:
+                yield animal
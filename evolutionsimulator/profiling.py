@@ -0,0 +1,87 @@
+import time
+from . import population
+
+
+class Profiler:
+    """Cumulative wall time and call counts per tick phase, and per action branch taken by the
+    mice and owls.
+
+    Attach one to an environment as env.profiler. Profilers of several simulations can be added
+    together with merge(), and summary() formats the totals as a table."""
+    species_names = {population.MOUSE: 'mice', population.OWL: 'owls'}
+
+    def __init__(self):
+        self.phase_time = {}
+        self.phase_calls = {}
+        self.actions = {population.MOUSE: {}, population.OWL: {}}
+        self.action_time = {population.MOUSE: {}, population.OWL: {}}
+        self.ticks = 0
+        # [start, seconds spent in nested actions] of every action that is running
+        self.running_actions = []
+
+    def time_phase(self, phase):
+        """Call phase() and add its wall time to the phase's totals."""
+        t0 = time.perf_counter()
+        phase()
+        name = phase.__name__
+        self.phase_time[name] = self.phase_time.get(name, 0) + time.perf_counter() - t0
+        self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+
+    def start_action(self):
+        self.running_actions.append([time.perf_counter(), 0])
+
+    def stop_action(self, species, branch):
+        """Count the action started last as taking branch, and add its wall time to the branch.
+
+        An action can run inside another one, like the turn an owl lets a mouse take before
+        catching it. Its time then only counts for the inner action."""
+        start, nested_seconds = self.running_actions.pop()
+        seconds = time.perf_counter() - start
+        self.count_action(species, branch, seconds=seconds - nested_seconds)
+        if self.running_actions:
+            self.running_actions[-1][1] += seconds
+
+    def count_action(self, species, branch, n=1, seconds=0):
+        actions, action_time = self.actions[species], self.action_time[species]
+        actions[branch] = actions.get(branch, 0) + n
+        action_time[branch] = action_time.get(branch, 0) + seconds
+
+    def merge(self, other):
+        for name, seconds in other.phase_time.items():
+            self.phase_time[name] = self.phase_time.get(name, 0) + seconds
+            self.phase_calls[name] = self.phase_calls.get(name, 0) + other.phase_calls[name]
+        for species, actions in other.actions.items():
+            for branch, count in actions.items():
+                self.count_action(species, branch, count, other.action_time[species][branch])
+        self.ticks += other.ticks
+
+    def to_dict(self):
+        return {'ticks': self.ticks,
+                'phases': {name: {'seconds': self.phase_time[name], 'calls': self.phase_calls[name]}
+                           for name in self.phase_time},
+                'actions': {self.species_names[species]: {branch: {'seconds': self.action_time[species][branch],
+                                                                   'calls': count}
+                                                          for branch, count in actions.items()}
+                            for species, actions in self.actions.items()}}
+
+    def summary(self):
+        total_time = sum(self.phase_time.values())
+        lines = [f'Profile of {self.ticks} ticks',
+                 f"{'phase':<20}{'calls':>10}{'total s':>12}{'ms/call':>10}{'share':>8}"]
+        for name, seconds in sorted(self.phase_time.items(), key=lambda item: -item[1]):
+            calls = self.phase_calls[name]
+            lines.append(f'{name:<20}{calls:>10}{seconds:>12.3f}{1000 * seconds / calls:>10.3f}'
+                         f'{100 * seconds / total_time if total_time else 0:>7.1f}%')
+
+        for species, actions in self.actions.items():
+            action_time = self.action_time[species]
+            total_actions, total_action_time = sum(actions.values()), sum(action_time.values())
+            lines.append('')
+            lines.append(f"{self.species_names[species] + ' actions':<20}{'count':>10}{'total s':>12}{'us/call':>10}"
+                         f"{'share':>8}{'time':>8}")
+            for branch, count in sorted(actions.items(), key=lambda item: -action_time[item[0]]):
+                seconds = action_time[branch]
+                lines.append(f'{branch:<20}{count:>10}{seconds:>12.3f}{1e6 * seconds / count:>10.1f}'
+                             f'{100 * count / total_actions:>7.1f}%'
+                             f'{100 * seconds / total_action_time if total_action_time else 0:>7.1f}%')
+        return '\n'.join(lines)
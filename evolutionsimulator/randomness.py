@@ -0,0 +1,58 @@
+import secrets
+import numpy as np
+
+
+def new_seed() -> int:
+    """Draw a fresh seed, so that even unseeded runs can be reproduced afterwards."""
+    return secrets.randbits(63)
+
+
+class RandomStream:
+    """The single source of randomness of an environment.
+
+    Wraps a NumPy Generator seeded once per environment. Scalar draws are served from
+    pre-drawn batches, so the many small draws made by the animals stay cheap, and the
+    same seed always gives the same stream - in-process or in a worker."""
+    batch_size = 4096
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.generator = np.random.default_rng(seed)
+        self.batch = []
+        self.position = 0
+
+    def random(self) -> float:
+        if self.position == len(self.batch):
+            self.batch = self.generator.random(RandomStream.batch_size).tolist()
+            self.position = 0
+        value = self.batch[self.position]
+        self.position += 1
+        return value
+
+    def randint(self, a: int, b: int) -> int:
+        """Random integer in [a, b], both included."""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, items: list) -> None:
+        items[:] = [items[i] for i in self.generator.permutation(len(items)).tolist()]
+
+    def integers(self, low: int, high: int, size) -> np.ndarray:
+        """Array of random integers in [low, high), for whole-array draws."""
+        return self.generator.integers(low, high, size=size)
+
+    def floats(self, size) -> np.ndarray:
+        """Array of random floats in [0, 1), for whole-array draws."""
+        return self.generator.random(size)
+
+    def get_state(self) -> dict:
+        """Everything needed to continue this stream elsewhere, including the unused part of the batch."""
+        return {'generator': self.generator.bit_generator.state,
+                'batch': self.batch[self.position:]}
+
+    def set_state(self, state: dict):
+        self.generator.bit_generator.state = state['generator']
+        self.batch = list(state['batch'])
+        self.position = 0
@@ -0,0 +1,132 @@
+import sys
+
+ROCK = 'rock'
+GRASS = 'grass'
+EMPTY = 'empty'
+
+controls = [" Space       -> Advance the simulation",
+            " Right arrow -> Increase simulation speed",
+            " Left arrow  -> Decrease simulation speed",
+            " S           -> Enable step-mode",
+            " T           -> enable tick-mode",
+            " R           -> Restart simulation",
+            " Q           -> Quit simulation"]
+
+
+def colored(text: str, color=None, attrs=None) -> str:
+    """termcolor.colored, imported on first use so headless runs never load termcolor."""
+    from termcolor import colored as termcolor_colored
+    return termcolor_colored(text, color, attrs=attrs)
+
+
+def move_to(line: int, column: int) -> str:
+    """ANSI escape moving the cursor to the given 1-based line and column."""
+    return f'\x1b[{line};{column}H'
+
+
+def clear_line() -> str:
+    return '\x1b[K'
+
+
+class TerminalRenderer:
+    """Draws an environment in the terminal, redrawing only what changed since the last frame.
+
+    Every cell is reduced to a small key (rock, grass, empty or the look of its animal) and the
+    colored glyph of each key is built once and cached. A frame moves the cursor to each cell
+    whose key changed and writes its glyph, so a quiet board costs next to nothing. The header
+    and the stats panel are rewritten only when their text changes. Each frame is sent to the
+    terminal in a single write."""
+    board_line = 4
+
+    def __init__(self, env, out=None):
+        self.env = env
+        self.out = out or sys.stdout
+        self.glyphs = {}
+        self.keys = None
+        self.lines = {}
+        self.field_size = env.field_size
+
+    def cell_key(self, tile):
+        if tile.rock:
+            return ROCK
+        animal = tile.animal
+        if animal:
+            return animal.species, animal.speed, animal.sex, animal.is_pregnant
+        return GRASS if tile.grass else EMPTY
+
+    def glyph(self, key, tile) -> str:
+        try:
+            return self.glyphs[key]
+        except KeyError:
+            glyph = self.glyphs[key] = str(tile)
+            return glyph
+
+    def cell_column(self, x: int) -> int:
+        return 5 + x * (self.env.field_size + 1)
+
+    def text_line(self, line: int, text: str):
+        """Escape sequence rewriting line with text, or '' if it already shows that text."""
+        if self.lines.get(line) == text:
+            return ''
+        self.lines[line] = text
+        return move_to(line, 1) + text + clear_line()
+
+    def stats_lines(self):
+        avg_speed_mice, avg_speed_owls = self.env.average_speed()
+        return [" Mice: {:<5}  Avg. speed: {}".format(self.env.mice_alive, avg_speed_mice),
+                " Owls: {:<5}  Avg. speed: {}".format(self.env.owls_alive, avg_speed_owls)]
+
+    def draw(self, full=False):
+        """Write one frame. A full frame clears the screen and redraws everything, including the controls."""
+        env = self.env
+        if env.field_size != self.field_size:
+            full = True
+        if full:
+            self.glyphs.clear()
+            self.keys = None
+            self.lines.clear()
+            self.field_size = env.field_size
+
+        parts = ['\x1b[2J'] if full else []
+        parts.append(self.text_line(1, " " + colored(f"Tick: {str(env.tick_no).ljust(5)}  "
+                                                      f"Step: {str(env.step_no).ljust(3)}", attrs=['underline'])))
+        if full:
+            parts.append(self.text_line(3, " " * 4 + ''.join("{:^{}} ".format(i + 1, env.field_size)
+                                                              for i in range(env.dimensions))))
+
+        keys = []
+        for y, row in enumerate(env.tiles):
+            row_keys = [self.cell_key(tile) for tile in row]
+            keys.append(row_keys)
+            line = self.board_line + y
+            if self.keys is None:
+                parts.append(move_to(line, 1) + " {:>2} ".format(y + 1)
+                             + ''.join(self.glyph(key, tile) + ' ' for key, tile in zip(row_keys, row)))
+            else:
+                old_keys = self.keys[y]
+                previous_x = -2
+                for x, key in enumerate(row_keys):
+                    if key != old_keys[x]:
+                        # a run of changed cells needs only one cursor move
+                        if x != previous_x + 1:
+                            parts.append(move_to(line, self.cell_column(x)))
+                        else:
+                            parts.append(' ')
+                        parts.append(self.glyph(key, row[x]))
+                        previous_x = x
+
+        # a fast animal may have widened every field while its glyph was built
+        if env.field_size != self.field_size:
+            return self.draw(full=True)
+        self.keys = keys
+
+        stats_line = self.board_line + env.dimensions + 1
+        for i, text in enumerate(self.stats_lines()):
+            parts.append(self.text_line(stats_line + i, text))
+        if full:
+            for i, text in enumerate([' ' + colored('Controls:', attrs=['underline'])] + controls):
+                parts.append(self.text_line(stats_line + 3 + i, text))
+
+        parts.append(move_to(stats_line + 12, 1))
+        self.out.write(''.join(parts))
+        self.out.flush()
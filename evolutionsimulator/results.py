@@ -0,0 +1,135 @@
+import csv
+import glob
+import os
+import time
+import uuid
+import numpy as np
+
+
+def parse_value(value):
+    """Turn a raw results value into a bool, int, float or string. 'N/A' becomes NaN."""
+    if isinstance(value, (bool, int, float)):
+        return value
+    if value in ('True', 'False'):
+        return value == 'True'
+    if value == 'N/A':
+        return np.nan
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def to_column(values):
+    """Typed array for one column of a batch."""
+    return np.array([parse_value(value) for value in values])
+
+
+class ResultsWriter:
+    """Base for the results backends. A job is marked as done in the done file only once its
+    row is safely on disk, so a resumed sweep never skips a lost result."""
+    def __init__(self, done_file):
+        self.index_file = open(done_file, 'a')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def mark_done(self, job_ids):
+        self.index_file.write(''.join(job_id + '\n' for job_id in job_ids))
+        self.index_file.flush()
+
+    def write(self, job_id, row):
+        raise NotImplementedError
+
+    def close(self):
+        self.index_file.close()
+
+
+class CsvResultsWriter(ResultsWriter):
+    """Appends every row to a CSV file as soon as it arrives."""
+    def __init__(self, path, done_file):
+        super().__init__(done_file)
+        self.csv_file = open(path, 'a', newline='')
+        self.writer = csv.writer(self.csv_file, delimiter=',')
+
+    def write(self, job_id, row):
+        self.writer.writerow(row)
+        self.csv_file.flush()
+        self.mark_done([job_id])
+
+    def close(self):
+        self.csv_file.close()
+        super().close()
+
+
+class NpzResultsWriter(ResultsWriter):
+    """Buffers rows and writes them as typed, compressed column batches.
+
+    Every batch becomes its own .npz shard in the results directory, so any number of writers
+    can add to the same results without coordinating. Use read_results to merge them."""
+    def __init__(self, directory, columns, done_file, batch_size=1000):
+        super().__init__(done_file)
+        self.directory = directory
+        self.columns = columns
+        self.batch_size = batch_size
+        self.name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.batch_no = 0
+        self.rows = []
+        self.job_ids = []
+
+    def write(self, job_id, row):
+        self.rows.append(row)
+        self.job_ids.append(job_id)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+
+        batch = {column: to_column(values) for column, values in zip(self.columns, zip(*self.rows))}
+        shard = os.path.join(self.directory, f'{self.name}-{self.batch_no:05d}.npz')
+        # write under a temporary name first, so readers never see a half-written shard
+        with open(shard + '.tmp', 'wb') as shard_file:
+            np.savez_compressed(shard_file, **batch)
+        os.replace(shard + '.tmp', shard)
+
+        self.mark_done(self.job_ids)
+        self.batch_no += 1
+        self.rows = []
+        self.job_ids = []
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+def read_results(directory):
+    """Merge all .npz shards in directory into one dict of column name -> array.
+
+    Columns missing from some shards are filled with NaN. The result can be passed straight
+    to pandas.DataFrame."""
+    shards = []
+    for shard_path in sorted(glob.glob(os.path.join(directory, '*.npz'))):
+        with np.load(shard_path) as shard:
+            shards.append({column: shard[column] for column in shard.files})
+
+    columns = []
+    for shard in shards:
+        columns.extend(column for column in shard if column not in columns)
+
+    merged = {}
+    for column in columns:
+        parts = [shard.get(column, np.full(len(next(iter(shard.values()))), np.nan)) for shard in shards]
+        try:
+            merged[column] = np.concatenate(parts)
+        except TypeError:
+            merged[column] = np.concatenate([part.astype(str) for part in parts])
+    return merged
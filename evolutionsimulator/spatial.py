@@ -0,0 +1,41 @@
+from typing import Optional, Tuple
+import numpy as np
+
+
+def distance(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    """Number of moves between two cells, as animals only move along rows and columns."""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+class SpatialIndex:
+    """Per-species occupancy grids for range queries.
+
+    grids[species, y, x] is True while an animal of that species stands on (x, y). A query
+    only looks at the cells within the radius, so its cost depends on the radius and not on
+    the number of animals."""
+    def __init__(self, dimensions: int, species_count=2):
+        self.dimensions = dimensions
+        self.grids = np.zeros((species_count, dimensions, dimensions), dtype=bool)
+
+    def add(self, species: int, x_y: Tuple[int, int]):
+        x, y = x_y
+        self.grids[species, y, x] = True
+
+    def remove(self, species: int, x_y: Tuple[int, int]):
+        x, y = x_y
+        self.grids[species, y, x] = False
+
+    def nearest(self, species: int, x_y: Tuple[int, int], radius: int) -> Optional[Tuple[int, int]]:
+        """Position of the closest animal of species at most radius moves away from x_y, or None."""
+        x, y = x_y
+        x_min, y_min = max(x - radius, 0), max(y - radius, 0)
+        window = self.grids[species, y_min:y + radius + 1, x_min:x + radius + 1]
+        ys, xs = np.nonzero(window)
+        if not ys.size:
+            return None
+
+        distances = np.abs(xs + x_min - x) + np.abs(ys + y_min - y)
+        i = int(np.argmin(distances))
+        if distances[i] > radius:
+            return None
+        return int(xs[i]) + x_min, int(ys[i]) + y_min
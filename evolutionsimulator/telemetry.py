@@ -0,0 +1,53 @@
+import json
+import numpy as np
+from . import population
+
+
+class TelemetryRecorder:
+    """Environment observer that samples per-tick metrics and streams them to disk.
+
+    Every `every` ticks one JSON line is buffered with population counts, speed mean, variance
+    and histogram per species, births and deaths by cause since the previous sample, and grass
+    coverage. Buffered lines are written every `buffer_size` samples and on close()."""
+    speed_bins = [1, 11, 21, 31, 41, 51, 61, 71, 81, 91, 101, np.inf]
+
+    def __init__(self, path, every=1, buffer_size=100):
+        self.file = open(path, 'a')
+        self.every = every
+        self.buffer_size = buffer_size
+        self.lines = []
+        self.last_births = [0, 0]
+        self.last_deaths = {}
+
+    def __call__(self, env):
+        if env.tick_no % self.every == 0:
+            self.lines.append(json.dumps(self.sample(env)))
+            if len(self.lines) >= self.buffer_size:
+                self.flush()
+
+    def sample(self, env):
+        pop = env.population
+        record = {'tick': env.tick_no, 'grass_coverage': env.grass_coverage()}
+        for name, code in (('mice', population.MOUSE), ('owls', population.OWL)):
+            speeds = pop.speed[pop.live_slots(code, env.replicate)]
+            record[name] = int(speeds.size)
+            record[f'{name}_speed_mean'] = float(speeds.mean()) if speeds.size else None
+            record[f'{name}_speed_var'] = float(speeds.var()) if speeds.size else None
+            record[f'{name}_speed_hist'] = np.histogram(speeds, bins=self.speed_bins)[0].tolist()
+            record[f'{name}_born'] = env.births[code] - self.last_births[code]
+            for cause, counts in env.deaths.items():
+                record[f'{name}_died_{cause}'] = counts[code] - self.last_deaths.get(cause, [0, 0])[code]
+
+        self.last_births = list(env.births)
+        self.last_deaths = {cause: list(counts) for cause, counts in env.deaths.items()}
+        return record
+
+    def flush(self):
+        if self.lines:
+            self.file.write('\n'.join(self.lines) + '\n')
+            self.file.flush()
+            self.lines = []
+
+    def close(self):
+        self.flush()
+        self.file.close()
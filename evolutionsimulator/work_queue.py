@@ -0,0 +1,194 @@
+import contextlib
+import dataclasses
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from . import config
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def new_worker_id():
+    return f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}'
+
+
+class WorkQueue:
+    """Sweep jobs shared by any number of workers on any number of machines, in one SQLite file.
+
+    A coordinator adds the (job_id, sim_config, run, seed, telemetry_file) jobs of a sweep. Workers
+    claim a job for lease_seconds at a time and renew the lease while they run it. A job whose
+    lease ran out, because its worker crashed or lost the connection, is handed to the next
+    worker that asks, until it has been tried max_attempts times. Finished rows stay in the
+    queue until the coordinator collects them into its results file.
+
+    The file must be on a file system with working file locks, e.g. a local disk or a
+    properly configured network share."""
+    def __init__(self, path, lease_seconds=None, max_attempts=None, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, job TEXT, state TEXT, attempts INTEGER,
+                                             worker TEXT, lease_until REAL, row TEXT, error TEXT,
+                                             collected INTEGER DEFAULT 0);
+            CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);''')
+
+        # the coordinator's settings hold for every worker that joins later
+        for key, value in (('lease_seconds', lease_seconds), ('max_attempts', max_attempts)):
+            if value is not None:
+                self.connection.execute('INSERT OR REPLACE INTO settings VALUES (?, ?)', (key, str(value)))
+        settings = dict(self.connection.execute('SELECT key, value FROM settings'))
+        self.lease_seconds = float(settings.get('lease_seconds', 600))
+        self.max_attempts = int(settings.get('max_attempts', 3))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add_jobs(self, jobs):
+        """Queue jobs that are not in the queue yet. Returns how many were added."""
+        added = 0
+        with self.transaction():
+            for job_id, sim_config, run, seed, telemetry_file in jobs:
+                # typed values, so a worker builds the config.SimConfig without parsing strings
+                job = [dataclasses.asdict(sim_config), dataclasses.asdict(run), seed, telemetry_file]
+                added += self.connection.execute(
+                    'INSERT OR IGNORE INTO jobs (job_id, job, state, attempts) VALUES (?, ?, ?, 0)',
+                    (job_id, json.dumps(job), PENDING)).rowcount
+        return added
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Hold the write lock for the block, so no two workers claim the same job."""
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self.connection.execute('ROLLBACK')
+            raise
+        self.connection.execute('COMMIT')
+
+    def claim(self, worker):
+        """Lease the next job to worker and return it, or None if no job is ready."""
+        with self.transaction():
+            self.expire_leases()
+            found = self.connection.execute('SELECT job_id, job FROM jobs WHERE state = ? LIMIT 1',
+                                            (PENDING,)).fetchone()
+            if not found:
+                return None
+            job_id, job = found
+            self.connection.execute('UPDATE jobs SET state = ?, attempts = attempts + 1, worker = ?, lease_until = ? '
+                                    'WHERE job_id = ?', (RUNNING, worker, self.clock() + self.lease_seconds, job_id))
+        sim_config, run, seed, telemetry_file = json.loads(job)
+        return job_id, config.SimConfig(**sim_config), config.RunSettings(**run), seed, telemetry_file
+
+    def expire_leases(self):
+        """Put running jobs whose lease ran out back in line, or fail them if that was their last attempt.
+        Call it inside a transaction."""
+        self.connection.execute("UPDATE jobs SET state = CASE WHEN attempts < ? THEN ? ELSE ? END, worker = NULL, "
+                                "error = 'lease expired' WHERE state = ? AND lease_until <= ?",
+                                (self.max_attempts, PENDING, FAILED, RUNNING, self.clock()))
+
+    def renew(self, job_id, worker):
+        """Extend the lease of a running job. False if the job is no longer leased to worker."""
+        return self.update_running(job_id, worker, 'lease_until = ?', (self.clock() + self.lease_seconds,))
+
+    def complete(self, job_id, worker, row):
+        """Store the results row of a job. False if the lease was lost and another worker has the job."""
+        return self.update_running(job_id, worker, 'state = ?, row = ?', (DONE, json.dumps(row)))
+
+    def fail(self, job_id, worker, error):
+        """Give a job back after an error. It is retried until it has been tried max_attempts times."""
+        return self.update_running(job_id, worker, 'state = CASE WHEN attempts < ? THEN ? ELSE ? END, error = ?',
+                                   (self.max_attempts, PENDING, FAILED, error))
+
+    def update_running(self, job_id, worker, assignments, values):
+        return self.connection.execute(f'UPDATE jobs SET {assignments} WHERE job_id = ? AND worker = ? AND state = ?',
+                                       values + (job_id, worker, RUNNING)).rowcount == 1
+
+    def collect(self):
+        """List (job_id, row) of the jobs finished since the last collect."""
+        with self.transaction():
+            finished = self.connection.execute('SELECT job_id, row FROM jobs WHERE state = ? AND collected = 0',
+                                               (DONE,)).fetchall()
+            self.connection.executemany('UPDATE jobs SET collected = 1 WHERE job_id = ?',
+                                        [(job_id,) for job_id, row in finished])
+        return [(job_id, json.loads(row)) for job_id, row in finished]
+
+    def counts(self):
+        """Number of jobs in each state."""
+        counts = dict.fromkeys((PENDING, RUNNING, DONE, FAILED), 0)
+        counts.update(self.connection.execute('SELECT state, COUNT(*) FROM jobs GROUP BY state'))
+        return counts
+
+    def is_finished(self):
+        """True once every job is done or has failed for good. Leases that ran out are applied first,
+        so a job whose worker died on its last attempt counts as failed rather than running."""
+        with self.transaction():
+            self.expire_leases()
+            counts = self.counts()
+        return not counts[PENDING] and not counts[RUNNING]
+
+    def errors(self):
+        """(job_id, error) of every job that failed for good."""
+        return self.connection.execute('SELECT job_id, error FROM jobs WHERE state = ?', (FAILED,)).fetchall()
+
+
+def run_worker(path, worker=None, poll_seconds=2, job_function=None):
+    """Claim and run jobs from the queue at path until every job is done or has failed.
+
+    Runs each job with job_function, by default automatic_testing.run_job, and renews its lease
+    from a background thread meanwhile. Returns the number of jobs this worker finished."""
+    if job_function is None:
+        from .automatic_testing import run_job as job_function
+    worker = worker or new_worker_id()
+    finished = 0
+
+    with WorkQueue(path) as queue:
+        while True:
+            job = queue.claim(worker)
+            if job is None:
+                if queue.is_finished():
+                    return finished
+                # other workers are still busy, and their jobs come back if they crash
+                time.sleep(poll_seconds)
+                continue
+
+            job_id = job[0]
+            stop_renewing = threading.Event()
+            renewer = threading.Thread(target=renew_lease, args=(path, job_id, worker, queue.lease_seconds / 3,
+                                                                 stop_renewing), daemon=True)
+            renewer.start()
+            try:
+                job_id, row, profiler = job_function(job)
+            except Exception:
+                stop_renewing.set()
+                renewer.join()
+                queue.fail(job_id, worker, traceback.format_exc())
+                continue
+            stop_renewing.set()
+            renewer.join()
+            if queue.complete(job_id, worker, row):
+                finished += 1
+
+
+def renew_lease(path, job_id, worker, interval, stop):
+    # a connection of its own, as SQLite connections can't be shared between threads
+    with WorkQueue(path) as queue:
+        while not stop.wait(interval):
+            if not queue.renew(job_id, worker):
+                return
@@ -0,0 +1,24 @@
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.benchmark as benchmark
+
+
+class Benchmark(TestCase):
+    def setUp(self) -> None:
+        self.case = {'dimensions': 10, 'density': 0.3, 'rock_chance': 10, 'grass_grow_back': 3}
+
+    def test_tick_benchmark(self) -> None:
+        result = benchmark.run_tick_benchmark(self.case, ticks=5)
+        self.assertEqual(result['ticks'], 5)
+        self.assertGreater(result['ticks_per_sec'], 0)
+        self.assertGreater(result['animal_updates_per_sec'], 0)
+
+    def test_compare(self) -> None:
+        baseline = {'tick_benchmarks': [dict(self.case, ticks_per_sec=100.0)]}
+        self.assertEqual(benchmark.compare(baseline, {'tick_benchmarks': [dict(self.case, ticks_per_sec=95.0)]}), [])
+        self.assertEqual(len(benchmark.compare(baseline, {'tick_benchmarks': [dict(self.case, ticks_per_sec=80.0)]})), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
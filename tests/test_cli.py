@@ -0,0 +1,44 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.cli as cli
+
+
+class Cli(TestCase):
+    def setUp(self) -> None:
+        self.cfg_file = 'complex_case_1.ini'
+
+    def run_cli(self, *args) -> str:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(cli.main(list(args)), 0)
+        return out.getvalue()
+
+    def test_run_is_seeded(self) -> None:
+        outcomes = [json.loads(self.run_cli('run', self.cfg_file, '--ticks', '5', '--seed', '3', '--json'))
+                    for i in range(2)]
+        self.assertEqual(outcomes[0], outcomes[1])
+        self.assertEqual(outcomes[0]['seed'], 3)
+
+    def test_run_rejects_bad_config(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                cli.main(['run', 'no_such_config.ini'])
+
+    def test_run_loads_no_interface_modules(self) -> None:
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(cli.__file__)))
+        code = ("import sys; from evolutionsimulator import cli; cli.main(['run', sys.argv[1], '--ticks', '2']); "
+                "print([name for name in ('tkinter', 'termcolor', 'psutil', 'keyboard') if name in sys.modules])")
+        output = subprocess.run([sys.executable, '-c', code, self.cfg_file], capture_output=True, text=True, check=True,
+                                env=dict(os.environ, PYTHONPATH=package_dir)).stdout
+        self.assertEqual(output.splitlines()[-1], '[]')
+
+
+if __name__ == "__main__":
+    unittest.main()
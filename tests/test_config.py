@@ -0,0 +1,74 @@
+import dataclasses
+import pickle
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.config as config
+import evolutionsimulator.environment as environment
+import configparser
+
+
+class SimConfig(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+
+    def test_parsed_settings(self) -> None:
+        sim_config = config.SimConfig.from_parser(self.config_parser)
+        self.assertEqual(sim_config.dimensions, 20)
+        self.assertEqual(sim_config.o_die_of_hunger, 5)
+        self.assertIs(sim_config.rand_catch, False)
+        self.assertIs(sim_config.inherit_speed, True)
+        # optional settings missing from the file
+        self.assertEqual((sim_config.m_vision, sim_config.owls_target_slow_mice), (1, False))
+
+    def test_frozen_and_hashable(self) -> None:
+        sim_config = config.SimConfig.from_parser(self.config_parser)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            sim_config.dimensions = 5
+
+        same = config.SimConfig.from_dict(sim_config.to_dict())
+        self.assertEqual(sim_config, same)
+        self.assertEqual(len({sim_config, same, pickle.loads(pickle.dumps(sim_config))}), 1)
+        self.assertEqual(sim_config.key(), same.key())
+        self.assertNotEqual(sim_config.key(), sim_config.replace(dimensions=21).key())
+
+    def test_invalid_settings(self) -> None:
+        for section, key, value in [('MICE', 'm_preg_time', 'soon'), ('ENVIRONMENT', 'rock_chance', '150'),
+                                    ('OWLS', 'o_max_age', '-1'), ('MICE', 'm_number', '500')]:
+            config_parser = configparser.ConfigParser()
+            config_parser.read(self.cfg_file)
+            config_parser[section][key] = value
+            with self.assertRaises(ValueError, msg=f'{key} = {value}'):
+                config.SimConfig.from_parser(config_parser)
+
+        self.config_parser.remove_option('MICE', 'm_max_age')
+        with self.assertRaises(ValueError):
+            config.SimConfig.from_parser(self.config_parser)
+
+    def test_environment_from_config(self) -> None:
+        self.config_parser['MICE']['m_number'] = '30'
+        from_parser = environment.Environment(self.config_parser, seed=4)
+        from_config = environment.Environment(config.SimConfig.from_parser(self.config_parser), seed=4)
+        from_parser.multiple_ticks(10)
+        from_config.multiple_ticks(10)
+        self.assertEqual(from_parser.config, from_config.config)
+        self.assertEqual([str(tile) for row in from_parser.tiles for tile in row],
+                         [str(tile) for row in from_config.tiles for tile in row])
+
+
+class RunSettings(TestCase):
+    def test_from_section(self) -> None:
+        config_parser = configparser.ConfigParser()
+        config_parser['AUTO_TESTING'] = {'ticks': '500', 'stop_when': 'extinction, plateau', 'profile': 'True'}
+        run = config.RunSettings.from_section(config_parser['AUTO_TESTING'])
+        self.assertEqual(run.run_length(), (500, ['extinction', 'plateau'], 50, 0))
+        self.assertEqual(run.values(), [500, 'extinction, plateau', 50, 0])
+        self.assertIs(run.profile, True)
+        self.assertEqual(run, config.RunSettings(**dataclasses.asdict(run)))
+        self.assertEqual(len(run.values()), len(config.RunSettings.columns))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.config as config
+import evolutionsimulator.ensemble as ensemble
+import evolutionsimulator.environment as environment
+import evolutionsimulator.population as population
+import configparser
+
+
+class Ensemble(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['MICE']['m_die_of_hunger'] = '4'
+        self.config_parser['OWLS']['o_number'] = '6'
+        self.config_parser['ENVIRONMENT']['rock_chance'] = '10'
+        self.config_parser['ENVIRONMENT']['grass_grow_back'] = '3'
+
+    def assert_consistent(self, replicates) -> None:
+        pop = replicates.population
+        for env in replicates.environments:
+            for species, animals in ((population.MOUSE, env.mice), (population.OWL, env.owls)):
+                slots = sorted(animal.slot for animal in animals)
+                self.assertEqual(slots, sorted(pop.live_slots(species, env.replicate).tolist()))
+                for animal in animals:
+                    self.assertIs(env.tiles[animal.position[1]][animal.position[0]].animal, animal)
+        self.assertEqual(replicates.average_speeds(), [env.average_speed() for env in replicates.environments])
+
+    def test_replicates_stay_consistent(self) -> None:
+        replicates = ensemble.Ensemble(self.config_parser, 4, seed=3)
+        for i in range(20):
+            replicates.tick()
+            self.assert_consistent(replicates)
+        self.assertEqual([env.tick_no for env in replicates.environments], [20] * 4)
+
+    def test_seeded_ensemble_is_reproducible(self) -> None:
+        runs = []
+        for i in range(2):
+            replicates = ensemble.Ensemble(self.config_parser, 3, seeds=[1, 2, 3])
+            replicates.multiple_ticks(15)
+            runs.append([(env.mice_alive, env.owls_alive, env.births, env.deaths) for env in replicates.environments])
+        self.assertEqual(runs[0], runs[1])
+        self.assertNotEqual(runs[0][0], runs[0][1], "Replicates with different seeds should differ")
+
+    def test_stopped_replicates_are_frozen(self) -> None:
+        self.config_parser['MICE']['m_number'] = '0'
+        self.config_parser['OWLS']['o_number'] = '0'
+        replicates = ensemble.Ensemble(self.config_parser, 2, seed=3)
+        stop_ticks = replicates.multiple_ticks(10, stop_when=['extinction'])
+        self.assertEqual(stop_ticks, [0, 0])
+        self.assertEqual([env.tick_no for env in replicates.environments], [0, 0])
+
+    def outcome(self, env):
+        return [str(tile) for row in env.tiles for tile in row], env.average_speed(), env.births, env.deaths
+
+    def test_replicates_match_separate_runs(self) -> None:
+        sim_config = config.SimConfig.from_parser(self.config_parser)
+        replicates = ensemble.Ensemble(sim_config, 4, seeds=[100, 101, 102, 103])
+        replicates.multiple_ticks(25)
+        for env, seed in zip(replicates.environments, [100, 101, 102, 103]):
+            separate = environment.Environment(sim_config, seed)
+            separate.multiple_ticks(25)
+            self.assertEqual(self.outcome(env), self.outcome(separate))
+
+    def test_replicate_does_not_depend_on_batch(self) -> None:
+        full = ensemble.Ensemble(self.config_parser, 4, seeds=[100, 101, 102, 103])
+        full.multiple_ticks(25)
+        without_first = ensemble.Ensemble(self.config_parser, 3, seeds=[101, 102, 103])
+        without_first.multiple_ticks(25)
+        self.assertEqual([self.outcome(env) for env in full.environments[1:]],
+                         [self.outcome(env) for env in without_first.environments])
+
+    def test_unknown_stop_condition(self) -> None:
+        replicates = ensemble.Ensemble(self.config_parser, 2, seed=3)
+        with self.assertRaises(ValueError):
+            replicates.multiple_ticks(10, stop_when=['never'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import io
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.config as config
+import evolutionsimulator.estimation as estimation
+import configparser
+
+
+class CostModel(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '40'
+
+    def test_bigger_boards_cost_more(self) -> None:
+        sim_config = config.SimConfig.from_parser(self.config_parser)
+        samples = [sim_config.replace(dimensions=10), sim_config.replace(dimensions=40, m_number=600)]
+        model = estimation.CostModel(sample_ticks=2)
+        model.calibrate(samples, ticks=100)
+
+        small, large = model.predict([10, 40], [40, 600])
+        self.assertGreater(large, small)
+        self.assertGreaterEqual(small, model.min_seconds)
+
+
+class Progress(TestCase):
+    def test_eta_from_throughput(self) -> None:
+        now = [0]
+        out = io.StringIO()
+        progress = estimation.Progress(4, estimate=100, out=out, log_interval=0, clock=lambda: now[0])
+        self.assertEqual(progress.seconds_left(), 100)
+
+        now[0] = 30
+        progress.update()
+        self.assertEqual(progress.seconds_left(), 90)
+        now[0] = 60
+        progress.update()
+        self.assertEqual(progress.seconds_left(), 60)
+        self.assertEqual(out.getvalue().splitlines()[-1], '2/4 simulations done, 2.0 per minute, about 1m 00s left')
+
+    def test_format_duration(self) -> None:
+        self.assertEqual(estimation.format_duration(42), '42s')
+        self.assertEqual(estimation.format_duration(125), '2m 05s')
+        self.assertEqual(estimation.format_duration(3 * 3600 + 60), '3h 01m')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,3 +6,120 @@ import configparser
 
 from evolutionsimulator import animals
 
+
+
+class GrassRegrowth(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['ENVIRONMENT']['grass_grow_back'] = '3'
+        self.env = environment.Environment(self.config_parser)
+
+    def test_eaten_grass_grows_back(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+        mouse = self.env.tiles[3][3].animal
+        tile = self.env.tiles[3][4]
+        tile.rock = False
+        tile.grass = True
+
+        self.env.animal_move_to(mouse, tile)
+        self.assertFalse(tile.grass, "The mouse should have eaten the grass")
+        self.assertEqual(tile.time_since_grass_eaten, 0)
+
+        for i in range(3):
+            self.env.grow_grass()
+            self.assertFalse(tile.grass, "Grass should not grow back before grass_grow_back ticks")
+        self.assertEqual(tile.time_since_grass_eaten, 3)
+        self.env.grow_grass()
+        self.assertTrue(tile.grass, "Grass should have grown back")
+
+    def test_rescheduled_grass(self) -> None:
+        tile = self.env.tiles[4][4]
+        tile.rock = False
+        tile.grass = False
+        tile.time_since_grass_eaten = 3
+        tile.time_since_grass_eaten = 2
+
+        self.env.grow_grass()
+        self.assertFalse(tile.grass, "Only the latest schedule should count")
+        self.env.grow_grass()
+        self.assertTrue(tile.grass)
+
+
+class Mating(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.env = environment.Environment(self.config_parser)
+
+    def add_animal(self, animal, x, y, sex):
+        self.env.add_animal_at(animal, self.env.tiles[y][x])
+        new_animal = self.env.tiles[y][x].animal
+        new_animal.pop.sex[new_animal.slot] = sex
+        return new_animal
+
+    def test_female_mates_with_male_next_to_her(self) -> None:
+        female = self.add_animal("mouse", 5, 5, 1)
+        male = self.add_animal("mouse", 5, 6, 0)
+        lone_female = self.add_animal("mouse", 10, 10, 1)
+        self.add_animal("mouse", 12, 10, 0)
+
+        self.env.update_pregnancies()
+
+        self.assertTrue(female.is_pregnant)
+        self.assertEqual(female.is_pregnant_with, male.ID)
+        self.assertFalse(lone_female.is_pregnant, "Males two tiles away are not mates")
+
+    def test_mates_found_after_moves(self) -> None:
+        female = self.add_animal("owl", 5, 5, 1)
+        male = self.add_animal("owl", 8, 5, 0)
+        self.add_animal("mouse", 5, 6, 0)
+
+        self.env.animal_move_to(male, self.env.tiles[5][6])
+        self.env.update_pregnancies()
+        self.assertTrue(female.is_pregnant)
+        self.assertEqual(female.is_pregnant_with, male.ID, "Only males of her own species are mates")
+
+
+class Neighbours(TestCase):
+    def test_neighbour_table_lists_reachable_tiles(self) -> None:
+        config_parser = configparser.ConfigParser()
+        config_parser.read('complex_case_1.ini')
+        config_parser['ENVIRONMENT']['rock_chance'] = '30'
+        env = environment.Environment(config_parser, seed=4)
+        for y, row in enumerate(env.tiles):
+            for x, tile in enumerate(row):
+                reachable = tuple(env.tiles[y + y_move][x + x_move] for x_move, y_move in animals.Animal.dir_options
+                                  if env.is_legal_coordinates((x + x_move, y + y_move))
+                                  and not env.tiles[y + y_move][x + x_move].rock)
+                self.assertEqual(env.neighbours[y * env.dimensions + x], reachable)
+
+
+class StopConditions(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.env = environment.Environment(self.config_parser)
+
+    def test_runs_all_ticks_by_default(self) -> None:
+        self.assertEqual(self.env.multiple_ticks(5), 5)
+        self.assertEqual(self.env.tick_no, 5)
+
+    def test_extinction_stops_run(self) -> None:
+        self.assertEqual(self.env.multiple_ticks(5, stop_when=['extinction']), 0)
+
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+        self.assertEqual(self.env.multiple_ticks(5, stop_when=['extinction']), 5)
+        self.assertEqual(self.env.multiple_ticks(5, stop_when=['owls_extinct']), 0)
+
+    def test_plateau_stops_run(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+
+        self.assertEqual(self.env.multiple_ticks(20, stop_when=['plateau'], plateau_ticks=4), 4)
+
+    def test_unknown_condition(self) -> None:
+        with self.assertRaises(ValueError):
+            self.env.multiple_ticks(5, stop_when=['boredom'])
@@ -0,0 +1,61 @@
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import configparser
+
+
+class PopulationStore(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.env = environment.Environment(self.config_parser)
+
+    def test_birth_records_parent_ids(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+        self.env.add_animal_at("mouse", self.env.tiles[3][4])
+        mother, father = self.env.tiles[3][3].animal, self.env.tiles[3][4].animal
+        mother.is_pregnant = True
+        mother.is_pregnant_with = father
+
+        self.env.add_animal_at("mouse", self.env.tiles[5][5], mother=mother)
+        child = self.env.tiles[5][5].animal
+
+        self.assertEqual(child.parents, [mother.ID, father.ID])
+        self.assertFalse(hasattr(child, '__dict__'), "Animals should be slotted proxies")
+
+    def test_slots_are_reused_after_tick(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+        mouse = self.env.tiles[3][3].animal
+        slot, animal_id = mouse.slot, mouse.ID
+        mouse.mark_as_dead()
+
+        self.env.add_animal_at("mouse", self.env.tiles[3][3])
+        self.assertNotEqual(self.env.tiles[3][3].animal.slot, slot, "Slots must not be reused within the same tick")
+
+        self.env.tick()
+        self.env.add_animal_at("mouse", self.env.tiles[8][8])
+        newest = self.env.tiles[8][8].animal
+        self.assertEqual(newest.slot, slot)
+        self.assertNotEqual(newest.ID, animal_id, "IDs are never reused")
+
+    def test_removal_during_activation(self) -> None:
+        for x in range(5):
+            self.env.add_animal_at("mouse", self.env.tiles[0][x])
+        mice = list(self.env.mice)
+
+        visited = []
+        for mouse in self.env.mice.activation_order():
+            visited.append(mouse)
+            if mouse is mice[0]:
+                mice[1].mark_as_dead()
+                self.env.add_animal_at("mouse", self.env.tiles[9][9])
+
+        self.assertEqual(visited, [mice[0]] + mice[2:], "Dead animals are skipped and newborns wait a tick")
+        self.assertEqual(len(self.env.mice), 5)
+        self.assertNotIn(mice[1], self.env.mice)
+
+
+if __name__ == "__main__":
+    unittest.main()
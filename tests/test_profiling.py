@@ -0,0 +1,67 @@
+import time
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import evolutionsimulator.population as population
+import evolutionsimulator.profiling as profiling
+import configparser
+
+
+class Profiling(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['OWLS']['o_number'] = '6'
+
+    def test_phases_and_actions(self) -> None:
+        env = environment.Environment(self.config_parser, seed=5)
+        env.profiler = profiling.Profiler()
+        env.multiple_ticks(5)
+
+        self.assertEqual(env.profiler.ticks, 5)
+        self.assertEqual(set(env.profiler.phase_calls.values()), {5})
+        self.assertIn('mice_tick', env.profiler.phase_time)
+        self.assertGreater(sum(env.profiler.actions[population.MOUSE].values()), 0)
+        self.assertEqual(env.profiler.actions[population.MOUSE].keys(),
+                         env.profiler.action_time[population.MOUSE].keys())
+        self.assertGreater(sum(env.profiler.action_time[population.MOUSE].values()), 0)
+        self.assertEqual(env.profiler.running_actions, [])
+        self.assertIn('mice_tick', env.profiler.summary())
+        self.assertIn('us/call', env.profiler.summary())
+
+    def test_nested_action_time(self) -> None:
+        profiler = profiling.Profiler()
+        profiler.start_action()
+        profiler.start_action()
+        time.sleep(0.02)
+        profiler.stop_action(population.MOUSE, 'move')
+        profiler.stop_action(population.OWL, 'hunt')
+        self.assertGreaterEqual(profiler.action_time[population.MOUSE]['move'], 0.02)
+        self.assertLess(profiler.action_time[population.OWL]['hunt'], 0.01,
+                        "Time of a nested action should only count for the nested action")
+
+    def test_same_trajectory(self) -> None:
+        env = environment.Environment(self.config_parser, seed=5)
+        profiled_env = environment.Environment(self.config_parser, seed=5)
+        profiled_env.profiler = profiling.Profiler()
+        env.multiple_ticks(5)
+        profiled_env.multiple_ticks(5)
+        self.assertEqual((env.mice_alive, env.owls_alive), (profiled_env.mice_alive, profiled_env.owls_alive))
+
+    def test_merge(self) -> None:
+        first = profiling.Profiler()
+        first.count_action(population.OWL, 'hunt')
+        second = profiling.Profiler()
+        second.count_action(population.OWL, 'hunt', 2, seconds=0.5)
+        second.ticks = 3
+        first.merge(second)
+        self.assertEqual(first.actions[population.OWL]['hunt'], 3)
+        self.assertEqual(first.action_time[population.OWL]['hunt'], 0.5)
+        self.assertEqual(first.ticks, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import io
+import re
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import evolutionsimulator.rendering as rendering
+import configparser
+
+
+class Screen:
+    """Minimal terminal keeping the text written at each position, ignoring colors."""
+    def __init__(self):
+        self.cells = {}
+
+    def apply(self, output):
+        line = column = 1
+        for match in re.finditer(r'\x1b\[(\d+);(\d+)H|(\x1b\[2J)|(\x1b\[K)|\x1b\[[0-9;]*m|(.)', output, re.S):
+            move_line, move_column, clear, clear_to_end, char = match.groups()
+            if move_line:
+                line, column = int(move_line), int(move_column)
+            elif clear:
+                self.cells.clear()
+            elif clear_to_end:
+                self.cells = {(l, c): v for (l, c), v in self.cells.items() if l != line or c < column}
+            elif char is not None:
+                self.cells[line, column] = char
+                column += 1
+
+    def text(self):
+        return {position: char for position, char in self.cells.items() if char != ' '}
+
+
+class Rendering(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '40'
+        self.config_parser['OWLS']['o_number'] = '4'
+        self.env = environment.Environment(self.config_parser, seed=11)
+
+    def test_diff_frames_match_full_frame(self) -> None:
+        out = io.StringIO()
+        renderer = rendering.TerminalRenderer(self.env, out)
+        screen = Screen()
+        renderer.draw(full=True)
+        for i in range(5):
+            self.env.tick()
+            renderer.draw()
+        screen.apply(out.getvalue())
+
+        full_out = io.StringIO()
+        rendering.TerminalRenderer(self.env, full_out).draw(full=True)
+        full_screen = Screen()
+        full_screen.apply(full_out.getvalue())
+
+        self.assertEqual(screen.text(), full_screen.text())
+
+    def test_unchanged_frame_is_empty(self) -> None:
+        out = io.StringIO()
+        renderer = rendering.TerminalRenderer(self.env, out)
+        renderer.draw(full=True)
+        first_frame = out.tell()
+        renderer.draw()
+        self.assertLess(out.tell() - first_frame, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
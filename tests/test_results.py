@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+import evolutionsimulator.results as results
+
+
+class ColumnarResults(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.done_file = os.path.join(self.directory.name, 'jobs.done')
+        self.columns = ['dimensions', 'speed', 'avg_speed_owl', 'sim ver']
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_typed_columns_and_merge(self) -> None:
+        with results.NpzResultsWriter(self.directory.name, self.columns, self.done_file, batch_size=2) as writer:
+            writer.write('a', ['20', 'True', 'N/A', 1.0])
+            writer.write('b', ['20', 'False', 45, 1.0])
+            writer.write('c', ['30', 'True', 50, 1.0])
+        with results.NpzResultsWriter(self.directory.name, self.columns, self.done_file) as writer:
+            writer.write('d', ['40', 'True', 'N/A', 1.0])
+
+        merged = results.read_results(self.directory.name)
+
+        self.assertEqual(sorted(merged['dimensions'].tolist()), [20, 20, 30, 40])
+        self.assertEqual(merged['dimensions'].dtype, np.int64)
+        self.assertEqual(merged['speed'].dtype, bool)
+        self.assertEqual(int(np.isnan(merged['avg_speed_owl']).sum()), 2, "N/A should be stored as NaN")
+        with open(self.done_file) as index_file:
+            self.assertEqual(sorted(index_file.read().split()), ['a', 'b', 'c', 'd'])
+
+    def test_jobs_marked_done_only_when_flushed(self) -> None:
+        writer = results.NpzResultsWriter(self.directory.name, self.columns, self.done_file, batch_size=10)
+        writer.write('a', ['20', 'True', 'N/A', 1.0])
+        with open(self.done_file) as index_file:
+            self.assertEqual(index_file.read(), '')
+        writer.close()
+        with open(self.done_file) as index_file:
+            self.assertEqual(index_file.read().split(), ['a'])
+
+
+if __name__ == "__main__":
+    unittest.main()
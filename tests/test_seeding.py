@@ -0,0 +1,59 @@
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import configparser
+
+
+class Seeding(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['OWLS']['o_number'] = '6'
+        self.config_parser['ENVIRONMENT']['rock_chance'] = '10'
+
+    def run_environment(self, seed):
+        env = environment.Environment(self.config_parser, seed=seed)
+        env.multiple_ticks(30)
+        return env
+
+    def test_same_seed_same_run(self) -> None:
+        first, second = self.run_environment(42), self.run_environment(42)
+
+        self.assertEqual(first.mice_alive, second.mice_alive)
+        self.assertEqual(first.owls_alive, second.owls_alive)
+        self.assertEqual([str(tile) for row in first.tiles for tile in row],
+                         [str(tile) for row in second.tiles for tile in row])
+
+    def test_unseeded_run_records_seed(self) -> None:
+        env = self.run_environment(None)
+        replay = self.run_environment(env.seed)
+
+        self.assertEqual([mouse.speed for mouse in env.mice], [mouse.speed for mouse in replay.mice])
+
+    def test_step_mode_same_run(self) -> None:
+        ticked = self.run_environment(42)
+        stepped = environment.Environment(self.config_parser, seed=42)
+        while stepped.tick_no < 30:
+            stepped.step()
+
+        self.assertEqual(ticked.mice_alive, stepped.mice_alive)
+        self.assertEqual(ticked.owls_alive, stepped.owls_alive)
+        self.assertEqual([str(tile) for row in ticked.tiles for tile in row],
+                         [str(tile) for row in stepped.tiles for tile in row])
+
+    def test_tick_finishes_stepped_tick(self) -> None:
+        ticked = self.run_environment(42)
+        stepped = environment.Environment(self.config_parser, seed=42)
+        for i in range(5):
+            stepped.step()
+        stepped.multiple_ticks(30)
+
+        self.assertEqual(stepped.tick_no, 30)
+        self.assertEqual([mouse.speed for mouse in ticked.mice], [mouse.speed for mouse in stepped.mice])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import configparser
+
+
+class Snapshot(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['MICE']['m_die_of_hunger'] = '6'
+        self.config_parser['OWLS']['o_number'] = '6'
+        self.config_parser['ENVIRONMENT']['rock_chance'] = '10'
+        self.config_parser['ENVIRONMENT']['grass_grow_back'] = '3'
+
+    def board(self, env):
+        return [str(tile) for row in env.tiles for tile in row]
+
+    def test_restore_continues_run(self) -> None:
+        env = environment.Environment(self.config_parser, seed=8)
+        env.multiple_ticks(10)
+        snapshot = io.BytesIO()
+        env.snapshot(snapshot)
+        env.multiple_ticks(15)
+
+        snapshot.seek(0)
+        restored = environment.Environment.restore(snapshot)
+        self.assertEqual(restored.tick_no, 10)
+        restored.multiple_ticks(15)
+
+        self.assertEqual(self.board(env), self.board(restored))
+        self.assertEqual((env.mice_alive, env.owls_alive), (restored.mice_alive, restored.owls_alive))
+        self.assertEqual(env.births, restored.births)
+        self.assertEqual(env.deaths, restored.deaths)
+        self.assertEqual([mouse.ID for mouse in env.mice], [mouse.ID for mouse in restored.mice])
+
+    def test_fork_with_new_seed(self) -> None:
+        env = environment.Environment(self.config_parser, seed=8)
+        env.multiple_ticks(5)
+        snapshot = io.BytesIO()
+        env.snapshot(snapshot, compressed=False)
+
+        forks = []
+        for seed in (1, 1, 2):
+            snapshot.seek(0)
+            fork = environment.Environment.restore(snapshot, seed=seed)
+            fork.multiple_ticks(10)
+            forks.append(self.board(fork))
+
+        self.assertEqual(forks[0], forks[1], "Forks with the same seed should be identical")
+        self.assertNotEqual(forks[0], forks[2])
+
+    def test_snapshot_to_path(self) -> None:
+        env = environment.Environment(self.config_parser, seed=8)
+        env.multiple_ticks(5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state')
+            env.snapshot(path)
+            self.assertEqual(os.listdir(directory), ['state'], "The path should be used as given")
+            restored = environment.Environment.restore(path)
+        self.assertEqual(self.board(env), self.board(restored))
+
+    def test_no_snapshot_mid_step(self) -> None:
+        env = environment.Environment(self.config_parser, seed=8)
+        env.step()
+        with self.assertRaises(ValueError):
+            env.snapshot(io.BytesIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import evolutionsimulator.telemetry as telemetry
+import configparser
+
+
+class Telemetry(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['MICE']['m_die_of_hunger'] = '4'
+        self.config_parser['OWLS']['o_number'] = '6'
+        self.env = environment.Environment(self.config_parser, seed=3)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'telemetry.jsonl')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_sampled_records(self) -> None:
+        recorder = telemetry.TelemetryRecorder(self.path, every=2)
+        self.env.add_observer(recorder)
+        self.env.multiple_ticks(6)
+        recorder.close()
+
+        with open(self.path) as telemetry_file:
+            records = [json.loads(line) for line in telemetry_file]
+
+        self.assertEqual([record['tick'] for record in records], [2, 4, 6])
+        self.assertEqual(records[-1]['mice'], self.env.mice_alive)
+        self.assertEqual(records[-1]['owls'], self.env.owls_alive)
+
+        # every change in the number of mice is accounted for by births and deaths
+        for previous, record in zip(records, records[1:]):
+            deaths = record['mice_died_hunger'] + record['mice_died_age'] + record['mice_died_eaten']
+            self.assertEqual(record['mice'] - previous['mice'], record['mice_born'] - deaths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from unittest import TestCase
+
+import evolutionsimulator.automatic_testing as automatic_testing
+import configparser
+
+
+class Tester(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['ENVIRONMENT']['dimensions'] = '10:20:5'
+        self.config_parser['ENVIRONMENT']['rock_chance'] = '0:10:10'
+        self.config_parser['MICE']['m_number'] = '5:6'
+        self.config_parser['AUTO_TESTING'] = {'ticks': '3', 'repetitions': '1', 'multi-core_mode': 'False',
+                                              'workers': '1', 'seed': '3', 'confirm': 'False'}
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def make_tester(self, **auto_testing):
+        self.config_parser['AUTO_TESTING'].update(auto_testing)
+        tester_cfg_file = os.path.join(self.directory.name, 'tester.ini')
+        with open(tester_cfg_file, 'w') as cfg_file:
+            self.config_parser.write(cfg_file)
+        return automatic_testing.Tester(tester_cfg_file)
+
+    def test_every_ranged_key_is_swept(self) -> None:
+        tester = self.make_tester()
+        sim_configs = list(tester.get_sim_configs())
+        self.assertEqual(tester.get_number_of_configs(), 12)
+        self.assertEqual([(sim_config.dimensions, sim_config.rock_chance, sim_config.m_number)
+                          for sim_config in sim_configs], list(product([10, 15, 20], [0, 10], [5, 6])))
+        self.assertEqual([tester.get_sim_config(i) for i in range(12)], sim_configs)
+
+    def test_jobs_of_each_repetition(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            jobs = list(self.make_tester(repetitions='2').get_jobs())
+        self.assertEqual(len(jobs), 24)
+        self.assertEqual(len({job[0] for job in jobs}), 24, "Every simulation should have its own job id")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual([job[0] for job in self.make_tester(repetitions='2').get_jobs()], [job[0] for job in jobs])
+
+    def test_resume_skips_finished_jobs(self) -> None:
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        self.addCleanup(os.chdir, cwd)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.make_tester(resume='True').start()
+            self.make_tester(resume='True', repetitions='2').start()
+            self.make_tester(resume='True', repetitions='2').start()
+
+        with open(automatic_testing.results_file, newline='') as results_csv:
+            rows = list(csv.reader(results_csv))[1:]
+        self.assertEqual(len(rows), 24, "Only the simulations of the new repetition should have been run")
+        with open(os.path.splitext(automatic_testing.results_file)[0] + '.done') as done_file:
+            self.assertEqual(len(set(done_file.read().split())), 24)
+
+    def test_jobs_left_ignores_other_sweeps(self) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            job_ids = [job[0] for job in self.make_tester(repetitions='2').get_jobs()]
+        tester = self.make_tester(repetitions='2')
+        tester.done_jobs = set(job_ids[:5]) | {f'job of another sweep {i}' for i in range(30)}
+        self.assertEqual(tester.count_jobs_left(), 19)
+
+    def run_sweep(self, **auto_testing):
+        """Run a sweep in a directory of its own and return its results rows, sorted."""
+        directory = tempfile.mkdtemp(dir=self.directory.name)
+        tester = self.make_tester(**auto_testing)
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                tester.start()
+            with open(automatic_testing.results_file, newline='') as results_csv:
+                return sorted(list(csv.reader(results_csv))[1:])
+        finally:
+            os.chdir(cwd)
+
+    def test_multi_core_rows_match_single_core(self) -> None:
+        single_core = self.run_sweep(repetitions='2')
+        self.assertEqual(len(single_core), 24)
+        self.assertEqual(self.run_sweep(repetitions='2', **{'multi-core_mode': 'True', 'workers': '2'}), single_core)
+
+    def test_ensemble_rows_match_separate_runs(self) -> None:
+        self.assertEqual(self.run_sweep(repetitions='3', ticks='15', ensemble='True'),
+                         self.run_sweep(repetitions='3', ticks='15'))
+
+    def test_closed_pool_cancels_waiting_jobs(self) -> None:
+        started = []
+
+        def job_function(job):
+            started.append(job)
+            time.sleep(0.05)
+            return job
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pool = automatic_testing.run_in_pool(executor, range(10), 4, job_function)
+            self.assertEqual(next(pool), 0)
+            pool.close()
+        self.assertLess(len(started), 4, "Jobs that had not started should have been cancelled")
+
+    def test_estimate_with_only_remote_workers(self) -> None:
+        tester = self.make_tester(**{'multi-core_mode': 'True', 'workers': '0', 'queue': 'queue.db'})
+        tester.num_of_configs = tester.get_number_of_configs()
+        self.assertGreater(tester.estimate_time(2, samples=1), 0)
+
+        with self.assertRaises(ValueError):
+            self.make_tester(queue='')
+
+    def test_queue_rejects_ensemble(self) -> None:
+        with self.assertRaises(ValueError):
+            self.make_tester(queue='queue.db', ensemble='True')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.environment as environment
+import evolutionsimulator.animals as animals
+import evolutionsimulator.population as population
+import evolutionsimulator.spatial as spatial
+import configparser
+
+
+class Vision(TestCase):
+    def setUp(self) -> None:
+        # Set up an empty test-environment where both species see 3 tiles away.
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_vision'] = '3'
+        self.config_parser['OWLS']['o_vision'] = '3'
+        self.env = environment.Environment(self.config_parser)
+
+    def test_nearest_within_radius(self) -> None:
+        index = spatial.SpatialIndex(10)
+        index.add(population.OWL, (5, 5))
+        index.add(population.OWL, (2, 2))
+
+        self.assertEqual(index.nearest(population.OWL, (3, 2), 3), (2, 2))
+        self.assertEqual(index.nearest(population.OWL, (5, 8), 3), (5, 5))
+        self.assertIsNone(index.nearest(population.OWL, (8, 8), 3), "Diagonal distance counts as two moves")
+        self.assertIsNone(index.nearest(population.MOUSE, (5, 5), 3))
+
+    def test_mouse_flees_owl_in_sight(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[10][10])
+        self.env.add_animal_at("owl", self.env.tiles[10][12])
+        mouse = self.env.tiles[10][10].animal
+
+        mouse.action()
+
+        self.assertEqual(spatial.distance(mouse.position, (12, 10)), 3, "The mouse should have moved away from the owl")
+
+    def test_owl_stalks_mouse_in_sight(self) -> None:
+        self.env.add_animal_at("mouse", self.env.tiles[10][10])
+        self.env.add_animal_at("owl", self.env.tiles[10][13])
+        owl = self.env.tiles[10][13].animal
+
+        owl.action()
+
+        self.assertEqual(owl.position, (12, 10), "The owl should have moved towards the mouse")
+
+    def test_index_follows_animals(self) -> None:
+        self.config_parser['MICE']['m_number'] = '60'
+        self.config_parser['MICE']['m_die_of_hunger'] = '4'
+        self.config_parser['OWLS']['o_number'] = '6'
+        env = environment.Environment(self.config_parser, seed=9)
+        env.multiple_ticks(20)
+
+        for species, animal_list in ((population.MOUSE, env.mice), (population.OWL, env.owls)):
+            positions = {(int(x), int(y)) for y, x in zip(*env.spatial_index.grids[species].nonzero())}
+            self.assertEqual(positions, {animal.position for animal in animal_list})
+
+    def test_no_index_by_default(self) -> None:
+        self.config_parser['MICE']['m_vision'] = '1'
+        self.config_parser['OWLS']['o_vision'] = '1'
+        self.assertIsNone(environment.Environment(self.config_parser).spatial_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
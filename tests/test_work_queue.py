@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+import evolutionsimulator.automatic_testing as automatic_testing
+import evolutionsimulator.config as config
+import evolutionsimulator.work_queue as work_queue
+import configparser
+
+
+class WorkQueue(TestCase):
+    def setUp(self) -> None:
+        self.config_parser = configparser.ConfigParser()
+        self.cfg_file = 'complex_case_1.ini'
+        self.config_parser.read(self.cfg_file)
+        self.config_parser['MICE']['m_number'] = '30'
+        self.config_parser['AUTO_TESTING'] = {'ticks': '5'}
+        sim_config = config.SimConfig.from_parser(self.config_parser)
+        run = config.RunSettings.from_section(self.config_parser['AUTO_TESTING'])
+        self.jobs = [(f'job{i}', sim_config, run, i, None) for i in range(4)]
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue_file = os.path.join(self.directory.name, 'queue.db')
+        self.now = 0
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def queue(self, **settings):
+        return work_queue.WorkQueue(self.queue_file, clock=lambda: self.now, **settings)
+
+    def test_claim_complete_collect(self) -> None:
+        with self.queue() as queue:
+            self.assertEqual(queue.add_jobs(self.jobs[:2]), 2)
+            self.assertEqual(queue.add_jobs(self.jobs[:2]), 0, "Jobs already queued should not be added again")
+
+            first, second = queue.claim('a'), queue.claim('b')
+            self.assertNotEqual(first[0], second[0])
+            self.assertIn(first, self.jobs[:2], "A claimed job should come back as it was added")
+            self.assertIsNone(queue.claim('c'))
+
+            self.assertTrue(queue.complete(first[0], 'a', ['row']))
+            self.assertEqual(queue.collect(), [(first[0], ['row'])])
+            self.assertEqual(queue.collect(), [])
+            self.assertFalse(queue.is_finished())
+
+    def test_expired_lease_is_retried(self) -> None:
+        with self.queue(lease_seconds=10) as queue:
+            queue.add_jobs(self.jobs[:1])
+            job = queue.claim('crashed')
+            self.now = 5
+            self.assertIsNone(queue.claim('other'))
+
+            self.now = 11
+            self.assertEqual(queue.claim('other'), job)
+            self.assertFalse(queue.complete(job[0], 'crashed', ['late row']))
+            self.assertTrue(queue.complete(job[0], 'other', ['row']))
+            self.assertEqual(queue.collect(), [(job[0], ['row'])])
+
+    def test_dead_worker_on_last_attempt_finishes_queue(self) -> None:
+        with self.queue(lease_seconds=10, max_attempts=1) as queue:
+            queue.add_jobs(self.jobs[:1])
+            job = queue.claim('crashed')
+            self.assertFalse(queue.is_finished())
+
+            self.now = 11
+            self.assertTrue(queue.is_finished(), "A job whose lease ran out on its last attempt should fail")
+            self.assertEqual(queue.errors(), [(job[0], 'lease expired')])
+
+    def test_failing_job_is_given_up(self) -> None:
+        with self.queue(max_attempts=2) as queue:
+            queue.add_jobs(self.jobs[:1])
+            for attempt in range(2):
+                job = queue.claim('a')
+                queue.fail(job[0], 'a', 'error')
+            self.assertIsNone(queue.claim('a'))
+            self.assertTrue(queue.is_finished())
+            self.assertEqual(queue.errors(), [(job[0], 'error')])
+
+    def test_local_workers_finish_sweep(self) -> None:
+        with self.queue() as queue:
+            queue.add_jobs(self.jobs)
+        workers = [multiprocessing.Process(target=work_queue.run_worker, args=(self.queue_file,),
+                                           kwargs={'poll_seconds': 0.1}) for i in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        with self.queue() as queue:
+            self.assertTrue(queue.is_finished())
+            rows = dict(queue.collect())
+        expected = {job_id: row for job_id, row, profiler in map(automatic_testing.run_job, self.jobs)}
+        self.assertEqual(rows, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()